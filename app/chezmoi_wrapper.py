@@ -1,7 +1,11 @@
 """Wrapper for chezmoi CLI operations."""
 
+import asyncio
+import functools
+import os
+import shutil
 import subprocess
-from pathlib import Path
+import time
 from typing import Optional, Dict, Any
 
 
@@ -10,9 +14,44 @@ class ChezmoiCommandError(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=4096)
+def _expand(path: str) -> str:
+    """Expand ~ and canonicalize a path, memoized on the raw string.
+    
+    The same strings are expanded repeatedly while the user edits a path,
+    and the managed list rarely changes, so results are cached. The cache
+    is sized to hold a large managed list, so rebuilding the managed set
+    after an invalidation is mostly cache hits.
+    
+    Absolute paths without ".." components (what "~/..." expands to, and
+    managed entries once joined onto the destination directory) are only
+    normalized lexically, skipping realpath's per-component lstat calls. Symlinks in such paths are therefore compared
+    as written rather than by their targets; relative paths and paths with
+    ".." still go through realpath.
+    """
+    expanded = os.path.expanduser(path)
+    if os.path.isabs(expanded) and ".." not in expanded.split(os.sep):
+        return os.path.normpath(expanded)
+    return os.path.realpath(expanded)
+
+
 class ChezmoiWrapper:
     """Wrapper class for interacting with chezmoi CLI."""
     
+    # add() keyword -> chezmoi flag, in the order flags are passed
+    _ADD_FLAGS = (
+        ("template", "--template"),
+        ("encrypt", "--encrypt"),
+        ("exact", "--exact"),
+        ("executable", "--executable"),
+        ("private", "--private"),
+        ("readonly", "--readonly"),
+    )
+    
+    # Seconds to wait for quick queries vs. commands that may run scripts
+    _TIMEOUT = 30
+    _LONG_TIMEOUT = 300
+    
     def __init__(self, chezmoi_path: str = "chezmoi"):
         """Initialize the wrapper.
         
@@ -20,13 +59,32 @@ class ChezmoiWrapper:
             chezmoi_path: Path to the chezmoi executable
         """
         self.chezmoi_path = chezmoi_path
+        # subprocess only takes its posix_spawn fast path (no fork) when the
+        # executable includes a directory, so resolve it against PATH once.
+        self._executable = shutil.which(chezmoi_path) or chezmoi_path
+        # Set once a spawn fails with FileNotFoundError so later calls fail fast
+        self._missing = False
+        self._version: Optional[str] = None
+        # (timestamp, managed files) from the last `chezmoi managed` run
+        self._managed_cache: Optional[tuple[float, list[str]]] = None
+        self._managed_ttl = 2.0
+        # Normalized form of the cached managed list, built on first lookup
+        self._managed_set: Optional[set[str]] = None
     
-    def _run_command(self, *args: str, check: bool = True) -> tuple[str, str, int]:
+    def invalidate_cache(self) -> None:
+        """Drop cached query results so the next call hits chezmoi again."""
+        self._managed_cache = None
+        self._managed_set = None
+    
+    def _run_command(
+        self, *args: str, check: bool = True, timeout: Optional[float] = None
+    ) -> tuple[str, str, int]:
         """Run a chezmoi command.
         
         Args:
             *args: Command arguments
             check: Whether to raise an exception on non-zero exit code
+            timeout: Seconds before giving up (defaults to _TIMEOUT)
             
         Returns:
             Tuple of (stdout, stderr, returncode)
@@ -34,12 +92,19 @@ class ChezmoiWrapper:
         Raises:
             ChezmoiCommandError: If the command fails and check is True
         """
+        if self._missing:
+            raise ChezmoiCommandError(self._missing_message())
+        
         try:
+            # close_fds=False keeps subprocess on posix_spawn even where libc
+            # lacks closefrom support; Python's own fds are non-inheritable
+            # by default (PEP 446), so nothing extra leaks into chezmoi.
             result = subprocess.run(
-                [self.chezmoi_path] + list(args),
+                [self._executable, *args],
                 capture_output=True,
                 text=True,
-                timeout=30
+                close_fds=False,
+                timeout=self._TIMEOUT if timeout is None else timeout
             )
             
             if check and result.returncode != 0:
@@ -52,10 +117,85 @@ class ChezmoiWrapper:
         except subprocess.TimeoutExpired as e:
             raise ChezmoiCommandError(f"Command timed out: {' '.join(args)}") from e
         except FileNotFoundError as e:
+            self._missing = True
+            raise ChezmoiCommandError(self._missing_message()) from e
+    
+    async def _run_command_async(
+        self, *args: str, check: bool = True, timeout: Optional[float] = None
+    ) -> tuple[str, str, int]:
+        """Run a chezmoi command as an asyncio subprocess.
+        
+        Same contract as _run_command, but the wait happens on the event loop
+        instead of tying up a worker thread.
+        
+        Args:
+            *args: Command arguments
+            check: Whether to raise an exception on non-zero exit code
+            timeout: Seconds before giving up (defaults to _TIMEOUT)
+            
+        Returns:
+            Tuple of (stdout, stderr, returncode)
+            
+        Raises:
+            ChezmoiCommandError: If the command fails and check is True
+        """
+        if self._missing:
+            raise ChezmoiCommandError(self._missing_message())
+        
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                self._executable,
+                *args,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                close_fds=False,
+            )
+        except FileNotFoundError as e:
+            self._missing = True
+            raise ChezmoiCommandError(self._missing_message()) from e
+        
+        try:
+            stdout_bytes, stderr_bytes = await asyncio.wait_for(
+                proc.communicate(),
+                self._TIMEOUT if timeout is None else timeout
+            )
+        except TimeoutError as e:
+            proc.kill()
+            await proc.wait()
+            raise ChezmoiCommandError(f"Command timed out: {' '.join(args)}") from e
+        
+        stdout = stdout_bytes.decode(errors="replace")
+        stderr = stderr_bytes.decode(errors="replace")
+        if check and proc.returncode != 0:
             raise ChezmoiCommandError(
-                f"chezmoi not found at {self.chezmoi_path}. "
-                "Please install chezmoi or specify the correct path."
-            ) from e
+                f"Command failed: {' '.join(args)}\n"
+                f"Error: {stderr}"
+            )
+        
+        return stdout, stderr, proc.returncode
+    
+    def _missing_message(self) -> str:
+        """Build the error message for a missing chezmoi executable."""
+        return (
+            f"chezmoi not found at {self.chezmoi_path}. "
+            "Please install chezmoi or specify the correct path."
+        )
+    
+    def version(self) -> str:
+        """Get the chezmoi version string.
+        
+        The result is probed once and cached for the wrapper's lifetime.
+        
+        Returns:
+            Version output
+            
+        Raises:
+            ChezmoiCommandError: If the command fails
+        """
+        if self._version is None:
+            stdout, _, _ = self._run_command("--version")
+            self._version = stdout.strip()
+        return self._version
     
     def add(
         self,
@@ -84,26 +224,63 @@ class ChezmoiWrapper:
         Raises:
             ChezmoiCommandError: If the command fails
         """
-        args = ["add"]
-        
-        if template:
-            args.append("--template")
-        if encrypt:
-            args.append("--encrypt")
-        if exact:
-            args.append("--exact")
-        if executable:
-            args.append("--executable")
-        if private:
-            args.append("--private")
-        if readonly:
-            args.append("--readonly")
-        
-        args.append(path)
-        
-        stdout, _, _ = self._run_command(*args)
+        flags = self._add_flags(
+            (template, encrypt, exact, executable, private, readonly)
+        )
+        
+        try:
+            stdout, _, _ = self._run_command("add", *flags, path)
+        finally:
+            self.invalidate_cache()
         return stdout
     
+    async def add_async(
+        self,
+        path: str,
+        template: bool = False,
+        encrypt: bool = False,
+        exact: bool = False,
+        executable: bool = False,
+        private: bool = False,
+        readonly: bool = False,
+    ) -> str:
+        """Add a file to chezmoi without blocking the event loop.
+        
+        Takes the same arguments as add().
+        
+        Returns:
+            Command output
+            
+        Raises:
+            ChezmoiCommandError: If the command fails
+        """
+        flags = self._add_flags(
+            (template, encrypt, exact, executable, private, readonly)
+        )
+        
+        try:
+            stdout, _, _ = await self._run_command_async("add", *flags, path)
+        finally:
+            self.invalidate_cache()
+        return stdout
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _add_flags(enabled: tuple[bool, ...]) -> tuple[str, ...]:
+        """Get the flags for a combination of add() options.
+        
+        Args:
+            enabled: Option values in _ADD_FLAGS order
+            
+        Returns:
+            Tuple of chezmoi flags
+        """
+        return tuple(
+            flag
+            for (_, flag), on in zip(ChezmoiWrapper._ADD_FLAGS, enabled)
+            if on
+        )
+    
     def remove(self, path: str) -> str:
         """Remove a file from chezmoi.
         
@@ -116,7 +293,10 @@ class ChezmoiWrapper:
         Raises:
             ChezmoiCommandError: If the command fails
         """
-        stdout, _, _ = self._run_command("remove", path)
+        try:
+            stdout, _, _ = self._run_command("remove", path)
+        finally:
+            self.invalidate_cache()
         return stdout
     
     def diff(self, path: Optional[str] = None) -> str:
@@ -154,20 +334,59 @@ class ChezmoiWrapper:
         if path:
             args.append(path)
         
-        stdout, _, _ = self._run_command(*args)
+        try:
+            stdout, _, _ = self._run_command(*args, timeout=self._LONG_TIMEOUT)
+        finally:
+            self.invalidate_cache()
         return stdout
     
     def managed(self) -> list[str]:
         """Get list of managed files.
         
+        Results are cached for a short TTL and dropped whenever add, remove
+        or apply runs, so repeated lookups don't spawn chezmoi each time.
+        
         Returns:
             List of managed file paths
             
         Raises:
             ChezmoiCommandError: If the command fails
         """
+        now = time.monotonic()
+        if self._managed_cache is not None:
+            timestamp, files = self._managed_cache
+            if now - timestamp < self._managed_ttl:
+                return list(files)
+        
         stdout, _, _ = self._run_command("managed")
-        return [line.strip() for line in stdout.splitlines() if line.strip()]
+        files = [line for line in map(str.strip, stdout.splitlines()) if line]
+        self._managed_cache = (now, files)
+        self._managed_set = None
+        return list(files)
+    
+    def _managed_paths(self) -> set[str]:
+        """Get the normalized managed paths as a set for membership tests.
+        
+        Raises:
+            ChezmoiCommandError: If the command fails
+        """
+        files = self.managed()
+        if self._managed_set is None:
+            # chezmoi managed prints paths relative to the destination
+            # directory (the home directory by default); join them onto it
+            # so the result doesn't depend on the current directory
+            home = _expand("~")
+            normalized = set()
+            for managed in files:
+                try:
+                    normalized.add(
+                        _expand(os.path.join(home, os.path.expanduser(managed)))
+                    )
+                except (OSError, ValueError):
+                    # If normalization fails, skip this managed file
+                    continue
+            self._managed_set = normalized
+        return self._managed_set
     
     def status(self) -> str:
         """Get chezmoi status.
@@ -191,20 +410,17 @@ class ChezmoiWrapper:
             True if the file is managed
         """
         try:
-            managed_files = self.managed()
-            # Normalize the path for comparison
-            expanded_path = str(Path(path).expanduser().resolve())
-            
-            for managed in managed_files:
-                # Also normalize managed file paths
-                try:
-                    managed_expanded = str(Path(managed).expanduser().resolve())
-                    if expanded_path == managed_expanded:
-                        return True
-                except Exception:
-                    # If normalization fails, skip this managed file
-                    continue
-            
+            expanded_path = _expand(path)
+            home = _expand("~")
+        except (OSError, ValueError):
+            return False
+        
+        # chezmoi's destination directory is the home directory by default,
+        # so anything outside it can be rejected without running chezmoi
+        if not expanded_path.startswith(home.rstrip(os.sep) + os.sep):
             return False
+        
+        try:
+            return expanded_path in self._managed_paths()
         except ChezmoiCommandError:
             return False
@@ -36,6 +36,24 @@ PRESET_TEMPLATE = "template"
 PRESET_EXECUTABLE = "executable"
 PRESET_READONLY = "readonly"
 
+# Options enabled by each preset (all others are cleared)
+PRESET_OPTIONS = {
+    PRESET_PRIVATE: ("private",),
+    PRESET_TEMPLATE: ("template",),
+    PRESET_EXECUTABLE: ("executable",),
+    PRESET_READONLY: ("readonly",),
+}
+
+# Delay (seconds) after typing stops before the add preview refreshes and
+# FileInput checks the path
+PREVIEW_DEBOUNCE = 0.15
+
+# Most diff lines rendered in the diff view; Export writes the full diff
+DIFF_DISPLAY_MAX_LINES = 2000
+
+# Most diff characters rendered; past this the diff is cut and shown unhighlighted
+DIFF_HIGHLIGHT_MAX_CHARS = 256_000
+
 # Messages
 MSG_SUCCESS_ADDED = "File added successfully!"
 MSG_SUCCESS_REMOVED = "File removed successfully!"
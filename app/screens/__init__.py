@@ -1,5 +1,7 @@
 """Screen modules for the application."""
 
+import importlib
+
 __all__ = [
     "AddDotfileScreen",
     "DiffScreen",
@@ -9,9 +11,28 @@ __all__ = [
     "FileBrowserScreen",
 ]
 
-from .add import AddDotfileScreen
-from .diff import DiffScreen
-from .edit import EditScreen
-from .remove import RemoveScreen
-from .list import ListScreen
-from .browse import FileBrowserScreen
+# Screens are imported on first access (PEP 562) so startup only pays for
+# the screen the user actually opens.
+_LAZY = {
+    "AddDotfileScreen": "add",
+    "DiffScreen": "diff",
+    "EditScreen": "edit",
+    "RemoveScreen": "remove",
+    "ListScreen": "list",
+    "FileBrowserScreen": "browse",
+}
+
+
+def __getattr__(name: str):
+    """Import a screen class on first access."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,8 +1,12 @@
 """Screen for adding dotfiles to chezmoi."""
 
+import asyncio
+
 from textual import on
-from textual.widgets import Button, Label, ListView, ListItem, Static
+from textual.widgets import Button, Checkbox, Label, ListView, ListItem, Static
 from textual.containers import Container, Vertical, Horizontal
+from textual.content import Content
+from textual.timer import Timer
 
 from ..base_screen import BaseScreen
 from ..chezmoi_wrapper import ChezmoiWrapper, ChezmoiCommandError
@@ -14,7 +18,39 @@ from ..constants import (
     BUTTON_CANCEL,
     MSG_SUCCESS_ADDED,
     MSG_ERROR_ALREADY_MANAGED,
+    PREVIEW_DEBOUNCE,
+    PRESET_PRIVATE,
+    PRESET_TEMPLATE,
+    PRESET_EXECUTABLE,
+    PRESET_READONLY,
+    PRESET_OPTIONS,
 )
+from .browse import FileBrowserScreen
+
+
+# Labels for the common dotfiles, built once. Widgets can't be reused across
+# screen instances, but their immutable Content can, which skips re-parsing
+# each path as markup whenever the screen is pushed.
+_COMMON_FILE_LABELS = tuple(
+    (file_path, Content(file_path)) for file_path in COMMON_DOTFILES
+)
+
+
+class CommonFileItem(ListItem):
+    """List item carrying a common dotfile path."""
+    
+    def __init__(self, file_path: str, label: Content | None = None) -> None:
+        """Initialize the item.
+        
+        Args:
+            file_path: Dotfile path selected by this item
+            label: Prebuilt label content (defaults to the plain path)
+        """
+        super().__init__(
+            Label(label if label is not None else Content(file_path)),
+            classes="common-file-item",
+        )
+        self.file_path = file_path
 
 
 class CommonFilesPanel(ListView):
@@ -22,93 +58,14 @@ class CommonFilesPanel(ListView):
     
     def compose(self):
         """Compose the common files list."""
-        for file_path in COMMON_DOTFILES:
-            item = ListItem(Label(file_path), classes="common-file-item")
-            item.file_path = file_path  # Store as custom attribute
-            yield item
+        for file_path, label in _COMMON_FILE_LABELS:
+            yield CommonFileItem(file_path, label)
 
 
 class AddDotfileScreen(BaseScreen):
     """Screen for adding files to chezmoi with enhanced UI."""
     
-    CSS = """
-    AddDotfileScreen {
-        align: center middle;
-        layout: vertical;
-    }
-    
-    #add_container {
-        width: 80;
-        height: auto;
-        border: solid $primary;
-        padding: 1;
-    }
-    
-    .section {
-        margin: 1 0;
-        height: auto;
-    }
-    
-    .common-file-item {
-        padding: 0 1;
-    }
-    
-    .common-file-item:hover {
-        background: $boost;
-    }
-    
-    CommonFilesPanel {
-        height: 10;
-        border: solid $accent;
-        margin: 1 0;
-    }
-    
-    FileInput {
-        margin: 1 0;
-    }
-    
-    OptionsPanel {
-        border: solid $accent;
-        padding: 1;
-        height: auto;
-    }
-    
-    PreviewPanel {
-        border: solid $accent;
-        padding: 1;
-        height: auto;
-        margin: 1 0;
-    }
-    
-    ResultPanel {
-        border: solid $accent;
-        padding: 1;
-        height: auto;
-        margin: 1 0;
-        min-height: 3;
-    }
-    
-    .button-row {
-        layout: horizontal;
-        height: auto;
-        align: center middle;
-    }
-    
-    .button-row Button {
-        margin: 0 1;
-    }
-    
-    .preset-row {
-        layout: horizontal;
-        height: auto;
-        margin: 1 0;
-    }
-    
-    .preset-row Button {
-        margin: 0 1;
-        min-width: 15;
-    }
-    """
+    CSS_PATH = "../styles/add.tcss"
     
     def __init__(self, chezmoi: ChezmoiWrapper, *args, **kwargs):
         """Initialize the screen.
@@ -118,6 +75,7 @@ class AddDotfileScreen(BaseScreen):
         """
         super().__init__(*args, **kwargs)
         self.chezmoi = chezmoi
+        self._preview_timer: Timer | None = None
     
     def compose(self):
         """Compose the screen layout."""
@@ -133,10 +91,10 @@ class AddDotfileScreen(BaseScreen):
             
             yield Label("Quick Presets", classes="section")
             with Horizontal(classes="preset-row"):
-                yield Button("Private Config", id="preset_private")
-                yield Button("Template", id="preset_template")
-                yield Button("Executable", id="preset_executable")
-                yield Button("Readonly", id="preset_readonly")
+                yield Button("Private Config", id="preset_private", name=PRESET_PRIVATE, classes="preset")
+                yield Button("Template", id="preset_template", name=PRESET_TEMPLATE, classes="preset")
+                yield Button("Executable", id="preset_executable", name=PRESET_EXECUTABLE, classes="preset")
+                yield Button("Readonly", id="preset_readonly", name=PRESET_READONLY, classes="preset")
             
             yield Label("Advanced Options", classes="section")
             yield OptionsPanel(id="options_panel")
@@ -150,68 +108,58 @@ class AddDotfileScreen(BaseScreen):
     
     def on_mount(self) -> None:
         """Handle mount event."""
-        self.query_one("#file_input").focus()
+        # Resolve widgets once; handlers below run on every keystroke
+        self._file_input = self.query_one("#file_input", FileInput)
+        self._options = self.query_one("#options_panel", OptionsPanel)
+        self._preview = self.query_one("#preview_panel", PreviewPanel)
+        self._result = self.query_one("#result_panel", ResultPanel)
+        
+        self._file_input.focus()
         self._update_preview()
     
     @on(ListView.Selected)
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         """Handle selection from common files list."""
-        if event.item and hasattr(event.item, 'file_path'):
-            file_path = event.item.file_path
-            file_input = self.query_one("#file_input", FileInput)
-            file_input.value = file_path
+        if isinstance(event.item, CommonFileItem):
+            self._file_input.value = event.item.file_path
             self._update_preview()
-            file_input.focus()
+            self._file_input.focus()
     
     @on(FileInput.Changed)
     def on_file_input_changed(self, event: FileInput.Changed) -> None:
         """Handle file input changes."""
-        self._update_preview()
-    
-    @on(Button.Pressed, "#preset_private")
-    def on_preset_private(self) -> None:
-        """Apply private preset."""
-        options = self.query_one("#options_panel", OptionsPanel)
-        options.reset()
-        self.query_one("#private_check").value = True
-        self._update_preview()
-    
-    @on(Button.Pressed, "#preset_template")
-    def on_preset_template(self) -> None:
-        """Apply template preset."""
-        options = self.query_one("#options_panel", OptionsPanel)
-        options.reset()
-        options.query_one("#template_check").value = True
-        self._update_preview()
-    
-    @on(Button.Pressed, "#preset_executable")
-    def on_preset_executable(self) -> None:
-        """Apply executable preset."""
-        options = self.query_one("#options_panel", OptionsPanel)
-        options.reset()
-        options.query_one("#executable_check").value = True
-        self._update_preview()
-    
-    @on(Button.Pressed, "#preset_readonly")
-    def on_preset_readonly(self) -> None:
-        """Apply readonly preset."""
-        options = self.query_one("#options_panel", OptionsPanel)
-        options.reset()
-        self.query_one("#readonly_check").value = True
+        self._schedule_preview()
+    
+    @on(Checkbox.Changed)
+    def on_option_changed(self, event: Checkbox.Changed) -> None:
+        """Handle option checkbox changes."""
+        self._schedule_preview()
+    
+    def _schedule_preview(self) -> None:
+        """Refresh the preview once a burst of changes settles."""
+        # Coalesce keystrokes and checkbox toggles into a single refresh
+        if self._preview_timer is not None:
+            self._preview_timer.stop()
+        self._preview_timer = self.set_timer(PREVIEW_DEBOUNCE, self._update_preview)
+    
+    @on(Button.Pressed, ".preset")
+    def on_preset_pressed(self, event: Button.Pressed) -> None:
+        """Apply the preset bound to the pressed button."""
+        # Set every checkbox in one repaint without each one scheduling its
+        # own preview refresh, then refresh once
+        with self.app.batch_update(), self.prevent(Checkbox.Changed):
+            self._options.set_options(PRESET_OPTIONS[event.button.name])
         self._update_preview()
     
     def _update_preview(self) -> None:
         """Update the preview panel."""
-        file_input = self.query_one("#file_input", FileInput)
-        options = self.query_one("#options_panel", OptionsPanel)
-        preview = self.query_one("#preview_panel", PreviewPanel)
-        
-        preview.update_preview(file_input.value, options.get_options())
+        self._preview.update_preview(
+            self._file_input.value, self._options.get_options()
+        )
     
     @on(Button.Pressed, f"#{BUTTON_BROWSE}")
     def on_browse_pressed(self) -> None:
         """Handle browse button press."""
-        from .browse import FileBrowserScreen
         self.app.push_screen(FileBrowserScreen(self.chezmoi), self._handle_browse_result)
     
     def _handle_browse_result(self, result: str | None) -> None:
@@ -221,34 +169,39 @@ class AddDotfileScreen(BaseScreen):
             result: Selected file path or None
         """
         if result:
-            file_input = self.query_one("#file_input", FileInput)
-            file_input.value = result
+            self._file_input.value = result
             self._update_preview()
     
     @on(Button.Pressed, f"#{BUTTON_SUBMIT}")
-    def on_submit_pressed(self) -> None:
+    async def on_submit_pressed(self, event: Button.Pressed) -> None:
         """Handle submit button press."""
-        file_input = self.query_one("#file_input", FileInput)
-        result_panel = self.query_one("#result_panel", ResultPanel)
+        path = self._file_input.value
         
         # Validate input
-        is_valid, error_msg = file_input.validate_path(file_input.value)
+        is_valid, error_msg = self._file_input.validate_path(path)
         if not is_valid:
-            result_panel.show_error(error_msg)
+            self._result.show_error(error_msg)
             return
         
-        # Check if already managed
-        if self.chezmoi.is_managed(file_input.value):
-            result_panel.show_error(
-                f"{MSG_ERROR_ALREADY_MANAGED}. Use 'Edit' to modify it instead."
-            )
-            return
-        
-        # Get options and add file
-        options = self.query_one("#options_panel", OptionsPanel)
-        self._add_file(file_input.value, options.get_options())
+        # chezmoi calls block, so run them off the event loop and keep the
+        # button disabled meanwhile to prevent a double submit
+        submit_button = event.button
+        submit_button.disabled = True
+        self._result.show_info("Working...")
+        try:
+            # Check if already managed
+            if await asyncio.to_thread(self.chezmoi.is_managed, path):
+                self._result.show_error(
+                    f"{MSG_ERROR_ALREADY_MANAGED}. Use 'Edit' to modify it instead."
+                )
+                return
+            
+            # Get options and add file
+            await self._add_file(path, self._options.get_options())
+        finally:
+            submit_button.disabled = False
     
-    def _add_file(self, path: str, options: dict[str, bool]) -> None:
+    async def _add_file(self, path: str, options: dict[str, bool]) -> None:
         """Add file to chezmoi.
         
         Args:
@@ -256,7 +209,7 @@ class AddDotfileScreen(BaseScreen):
             options: Dictionary of options
         """
         try:
-            self.chezmoi.add(path, **options)
+            await self.chezmoi.add_async(path, **options)
             self._handle_add_complete(True, path, options)
         except ChezmoiCommandError as e:
             self._handle_add_complete(False, path, options, str(e))
@@ -270,8 +223,6 @@ class AddDotfileScreen(BaseScreen):
             options: Options used
             error: Error message if failed
         """
-        result_panel = self.query_one("#result_panel", ResultPanel)
-        
         if success:
             enabled_opts = [k for k, v in options.items() if v]
             opts_str = f" ({', '.join(enabled_opts)})" if enabled_opts else ""
@@ -285,14 +236,14 @@ class AddDotfileScreen(BaseScreen):
             if options.get("template"):
                 message += "\n[yellow]💡 Don't forget to use template variables![/yellow]"
             
-            result_panel.update(message)
+            self._result.update(message)
             
             # Clear form
-            self.query_one("#file_input").value = ""
-            self.query_one("#options_panel", OptionsPanel).reset()
+            self._file_input.value = ""
+            self._options.reset()
             self._update_preview()
         else:
-            result_panel.show_error(f"Failed to add file: {error}")
+            self._result.show_error(f"Failed to add file: {error}")
     
     @on(Button.Pressed, f"#{BUTTON_CANCEL}")
     def on_cancel_pressed(self) -> None:
@@ -2,7 +2,7 @@
 
 from pathlib import Path
 from textual.widgets import DirectoryTree, Button, Label
-from textual.containers import Container, Vertical
+from textual.containers import Container, Horizontal, Vertical
 from textual import on
 
 from ..base_screen import BaseScreen
@@ -13,33 +13,7 @@ from ..constants import BUTTON_CANCEL
 class FileBrowserScreen(BaseScreen):
     """Screen for browsing files."""
     
-    CSS = """
-    FileBrowserScreen {
-        align: center middle;
-    }
-    
-    #browser_container {
-        width: 80;
-        height: 30;
-        border: solid $primary;
-        padding: 1;
-    }
-    
-    DirectoryTree {
-        height: 1fr;
-    }
-    
-    .button-row {
-        layout: horizontal;
-        height: auto;
-        align: center middle;
-        margin: 1 0;
-    }
-    
-    .button-row Button {
-        margin: 0 1;
-    }
-    """
+    CSS_PATH = "../styles/browse.tcss"
     
     def __init__(self, chezmoi: ChezmoiWrapper, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -50,7 +24,6 @@ class FileBrowserScreen(BaseScreen):
         with Container(id="browser_container"):
             yield Label("Select a file")
             yield DirectoryTree(str(Path.home()))
-            from textual.containers import Horizontal
             with Horizontal(classes="button-row"):
                 yield Button("Cancel", id=BUTTON_CANCEL)
     
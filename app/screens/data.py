@@ -1,5 +1,7 @@
 """Template data viewer screen."""
 
+from itertools import islice
+
 from textual.app import ComposeResult
 from textual.containers import Vertical
 from textual.screen import Screen
@@ -10,50 +12,77 @@ from textual.worker import Worker, WorkerState
 from chezmoi import ChezmoiWrapper
 
 
+# Most children added when a single node is filled in, so one huge mapping
+# (e.g. a large env dict) can't stall the UI
+_MAX_CHILDREN = 5000
+
+
+def _add_dict_node(node: TreeNode, key, value: dict) -> None:
+    """Add a collapsed node for a dict; its contents load on first expand."""
+    node.add(f"[cyan]{key}[/cyan]", data=value, expand=False)
+
+
+def _add_list_node(node: TreeNode, key, value: list) -> None:
+    """Add a collapsed node for a list; its items load on first expand."""
+    node.add(f"[yellow]{key}[/yellow] ({len(value)} items)", data=value, expand=False)
+
+
+def _add_list_items(node: TreeNode, items: list) -> None:
+    """Add the items of a list; dict items load on first expand."""
+    for idx, item in enumerate(islice(items, _MAX_CHILDREN)):
+        if isinstance(item, dict):
+            node.add(f"[dim]{idx}[/dim]", data=item)
+        elif isinstance(item, list):
+            node.add(f"[dim]{idx}[/dim]").add_leaf(str(item))
+        else:
+            node.add_leaf(f"{idx}: {item}")
+    _add_truncated_leaf(node, len(items))
+
+
+def _add_truncated_leaf(node: TreeNode, total: int) -> None:
+    """Note how many children were left out when a container is capped."""
+    if total > _MAX_CHILDREN:
+        node.add_leaf(f"[dim]... ({total - _MAX_CHILDREN} more items truncated)[/dim]")
+
+
+def _add_bool_leaf(node: TreeNode, key, value: bool) -> None:
+    """Add a boolean value."""
+    node.add_leaf(f"[green]{key}[/green] = [magenta]{value}[/magenta]")
+
+
+def _add_number_leaf(node: TreeNode, key, value: int | float) -> None:
+    """Add a numeric value."""
+    node.add_leaf(f"[green]{key}[/green] = [blue]{value}[/blue]")
+
+
+def _add_null_leaf(node: TreeNode, key, value: None) -> None:
+    """Add a null value."""
+    node.add_leaf(f"[green]{key}[/green] = [dim]null[/dim]")
+
+
+def _add_str_leaf(node: TreeNode, key, value) -> None:
+    """Add a string (or any other) value, truncated for display."""
+    value_str = str(value)
+    if len(value_str) > 50:
+        value_str = value_str[:47] + "..."
+    node.add_leaf(f"[green]{key}[/green] = {value_str}")
+
+
+# Tree builders keyed by the exact JSON value type; anything else is a string
+_VALUE_HANDLERS = {
+    dict: _add_dict_node,
+    list: _add_list_node,
+    bool: _add_bool_leaf,
+    int: _add_number_leaf,
+    float: _add_number_leaf,
+    type(None): _add_null_leaf,
+}
+
+
 class TemplateDataScreen(Screen):
     """Screen for viewing template data."""
 
-    CSS = """
-    TemplateDataScreen {
-        align: center top;
-    }
-
-    #data-container {
-        width: 95%;
-        height: 1fr;
-        background: $panel;
-        border: solid $primary;
-        padding: 1 2;
-        margin: 1;
-    }
-
-    #data-title {
-        padding: 1 0;
-        text-style: bold;
-    }
-
-    Tree {
-        height: 1fr;
-        scrollbar-gutter: stable;
-    }
-
-    #actions-container {
-        dock: bottom;
-        height: auto;
-        width: 95%;
-        padding: 1 2;
-        align: center middle;
-    }
-
-    Button {
-        margin: 0 1;
-    }
-
-    .loading {
-        text-align: center;
-        padding: 2;
-    }
-    """
+    CSS_PATH = "../styles/data.tcss"
 
     BINDINGS = [
         ("escape", "pop_screen", "Back"),
@@ -92,12 +121,13 @@ class TemplateDataScreen(Screen):
 
     def load_data(self) -> None:
         """Load template data in background worker."""
-        self.run_worker(self._fetch_data, exclusive=True, thread=True)
+        self.run_worker(self._fetch_data, exclusive=True, exit_on_error=False)
 
     async def _fetch_data(self) -> dict:
         """Fetch template data from chezmoi."""
         try:
-            return ChezmoiWrapper.get_data()
+            # Run and parse in the shared pool; the JSON may be large
+            return await ChezmoiWrapper.run_blocking(ChezmoiWrapper.get_data)
         except Exception as e:
             self.app.notify(f"Error loading data: {e}", severity="error")
             return {}
@@ -105,8 +135,11 @@ class TemplateDataScreen(Screen):
     def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
         """Handle worker completion."""
         if event.state == WorkerState.SUCCESS:
-            if hasattr(event.worker, "result") and event.worker.result is not None:
-                self.update_tree(event.worker.result)
+            result = event.worker.result
+            if result is not None:
+                self.update_tree(result)
+        elif event.state == WorkerState.ERROR:
+            self.app.notify(f"Error loading data: {event.worker.error}", severity="error")
 
     def update_tree(self, data: dict) -> None:
         """Update tree with template data."""
@@ -126,45 +159,34 @@ class TemplateDataScreen(Screen):
 
         tree.label = "[bold cyan]Template Data[/bold cyan]"
 
-        # Build tree from data
-        self._add_dict_to_tree(tree.root, data)
-
-        tree.root.expand()
+        # Build tree from data, deferring repaints until every node is added
+        with self.app.batch_update():
+            self._add_dict_to_tree(tree.root, data)
+            tree.root.expand()
 
     def _add_dict_to_tree(self, node: TreeNode, data: dict) -> None:
-        """Recursively add dictionary data to tree."""
-        for key, value in data.items():
-            if isinstance(value, dict):
-                # Add as expandable node
-                child = node.add(f"[cyan]{key}[/cyan]", expand=False)
-                self._add_dict_to_tree(child, value)
-            elif isinstance(value, list):
-                # Add list
-                child = node.add(f"[yellow]{key}[/yellow] ({len(value)} items)")
-                for idx, item in enumerate(value):
-                    if isinstance(item, (dict, list)):
-                        item_node = child.add(f"[dim]{idx}[/dim]")
-                        if isinstance(item, dict):
-                            self._add_dict_to_tree(item_node, item)
-                        else:
-                            item_node.add_leaf(str(item))
-                    else:
-                        child.add_leaf(f"{idx}: {item}")
-            elif isinstance(value, bool):
-                # Boolean value
-                node.add_leaf(f"[green]{key}[/green] = [magenta]{value}[/magenta]")
-            elif isinstance(value, (int, float)):
-                # Numeric value
-                node.add_leaf(f"[green]{key}[/green] = [blue]{value}[/blue]")
-            elif value is None:
-                # Null value
-                node.add_leaf(f"[green]{key}[/green] = [dim]null[/dim]")
+        """Add one level of dictionary data to tree.
+
+        Nested dicts and lists become collapsed nodes holding their data, and
+        are only filled in by on_tree_node_expanded when the user opens them.
+        """
+        for key, value in islice(data.items(), _MAX_CHILDREN):
+            handler = _VALUE_HANDLERS.get(type(value), _add_str_leaf)
+            handler(node, key, value)
+        _add_truncated_leaf(node, len(data))
+
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded) -> None:
+        """Load a container node's children the first time it is expanded."""
+        node = event.node
+        pending = node.data
+        if pending is None:
+            return
+        node.data = None
+        with self.app.batch_update():
+            if isinstance(pending, dict):
+                self._add_dict_to_tree(node, pending)
             else:
-                # String value
-                value_str = str(value)
-                if len(value_str) > 50:
-                    value_str = value_str[:47] + "..."
-                node.add_leaf(f"[green]{key}[/green] = {value_str}")
+                _add_list_items(node, pending)
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -184,6 +206,7 @@ class TemplateDataScreen(Screen):
         tree = self.query_one("#data-tree", Tree)
         tree.display = False
 
+        ChezmoiWrapper.clear_caches()
         self.load_data()
         self.app.notify("Refreshing template data...", timeout=1)
 
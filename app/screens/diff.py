@@ -1,16 +1,57 @@
 """Screen for viewing and applying diffs."""
 
-import re
+import logging
+from bisect import bisect_left, bisect_right
 from datetime import datetime
+from functools import lru_cache, partial
 from pathlib import Path
 from textual.widgets import Button, Label, Static, ListView, ListItem
 from textual.containers import Container, Vertical, Horizontal, VerticalScroll
 from textual import on
+from textual.worker import Worker, WorkerState
+from rich.console import Group
 from rich.syntax import Syntax
+from rich.text import Text
 
 from ..base_screen import BaseScreen
-from ..chezmoi_wrapper import ChezmoiWrapper, ChezmoiCommandError
-from ..constants import BUTTON_APPLY, BUTTON_REFRESH, BUTTON_EXPORT
+from ..chezmoi_wrapper import ChezmoiWrapper
+from ..constants import (
+    BUTTON_APPLY,
+    BUTTON_REFRESH,
+    BUTTON_EXPORT,
+    DIFF_DISPLAY_MAX_LINES,
+    DIFF_HIGHLIGHT_MAX_CHARS,
+)
+
+logger = logging.getLogger(__name__)
+
+# Prefix of the per-file header line in git-style diffs
+_DIFF_HEADER = "diff --git a/"
+
+
+class _DiffSyntax(Syntax):
+    """Diff highlighter that tokenizes its code once.
+    
+    Rich re-runs the lexer every time a Syntax is rendered (each update and
+    each resize); this keeps the first result and hands out copies.
+    """
+    
+    def __init__(self, code: str) -> None:
+        super().__init__(code, "diff", theme="monokai", line_numbers=True)
+        self._highlighted: dict = {}
+    
+    def highlight(self, code, line_range=None) -> Text:
+        """Highlight code, reusing an earlier result for the same range."""
+        # code is always derived from self.code, so the range alone is the key
+        text = self._highlighted.get(line_range)
+        if text is None:
+            text = self._highlighted[line_range] = super().highlight(code, line_range)
+        # Rendering may modify the Text in place
+        return text.copy()
+    
+    def prepare(self) -> None:
+        """Tokenize ahead of the first render, e.g. from a worker thread."""
+        self.highlight(self._process_code(self.code)[1], self.line_range)
 
 
 class StatisticsPanel(Static):
@@ -19,19 +60,30 @@ class StatisticsPanel(Static):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.border_title = "Statistics"
+        # Last (files, additions, deletions) shown, to skip no-op updates
+        self._last_stats = None
     
     def update_stats(self, files: int, additions: int, deletions: int) -> None:
         """Update statistics display."""
-        net_change = additions - deletions
-        net_symbol = "+" if net_change >= 0 else ""
+        stats = (files, additions, deletions)
+        if stats == self._last_stats:
+            return
+        self._last_stats = stats
         
-        content = (
+        self.update(
             f"[bold]Files changed:[/bold] {files}\n"
             f"[green]+{additions} additions[/green]\n"
             f"[red]-{deletions} deletions[/red]\n"
-            f"[bold]Net change:[/bold] {net_symbol}{net_change}"
+            f"[bold]Net change:[/bold] {additions - deletions:+d}"
         )
-        self.update(content)
+
+
+class FileListItem(ListItem):
+    """List entry for one changed file."""
+    
+    def __init__(self, file_path: str) -> None:
+        super().__init__(Label(file_path))
+        self.file_path = file_path
 
 
 class FileListPanel(ListView):
@@ -39,68 +91,19 @@ class FileListPanel(ListView):
     
     def update_files(self, files: list[str]) -> None:
         """Update the file list."""
-        self.clear()
-        for file_path in files:
-            item = ListItem(Label(file_path))
-            item.file_path = file_path
-            self.append(item)
+        items = [FileListItem(file_path) for file_path in files]
+        
+        # Mount every item in one call rather than one mount per file, and
+        # repaint once for the clear and the refill together
+        with self.app.batch_update():
+            self.clear()
+            self.extend(items)
 
 
 class DiffScreen(BaseScreen):
     """Screen for viewing chezmoi diffs with enhanced features."""
     
-    CSS = """
-    DiffScreen {
-        layout: horizontal;
-    }
-    
-    #sidebar {
-        width: 30;
-        border-right: solid $primary;
-        padding: 1;
-    }
-    
-    #main_content {
-        width: 1fr;
-        padding: 1;
-    }
-    
-    StatisticsPanel {
-        border: solid $accent;
-        padding: 1;
-        height: auto;
-        margin-bottom: 1;
-    }
-    
-    FileListPanel {
-        border: solid $accent;
-        height: 1fr;
-    }
-    
-    #diff_container {
-        border: solid $accent;
-        height: 1fr;
-        padding: 1;
-    }
-    
-    #error_panel {
-        border: solid red;
-        padding: 1;
-        height: auto;
-        background: $error;
-        margin: 1 0;
-    }
-    
-    .button-row {
-        layout: horizontal;
-        height: auto;
-        margin: 1 0;
-    }
-    
-    .button-row Button {
-        margin: 0 1;
-    }
-    """
+    CSS_PATH = "../styles/diff.tcss"
     
     BINDINGS = [
         ("n", "next_change", "Next"),
@@ -114,6 +117,22 @@ class DiffScreen(BaseScreen):
         self.current_diff = ""
         self.changed_files = []
         self.selected_file = None
+        # Line indices where each block of changes starts, for n/p navigation
+        self._change_starts: list[int] = []
+        # (file_path, diff_text) currently rendered, so an identical reload
+        # can skip re-parsing and re-rendering
+        self._shown: tuple[str | None, str] | None = None
+        # Whether the displayed diff has anything for apply to do
+        self._has_changes = False
+        # chezmoi diff output by target (None for all files); cleared on
+        # refresh and apply. Only touched on the UI thread: workers get a
+        # copy, and their results are stored if the generation still matches
+        self._diff_cache: dict[str | None, str] = {}
+        self._cache_generation = 0
+        # Highlighter per diff text, so revisits skip the lexer. Kept on the
+        # screen rather than the module so a highlight still running in a
+        # worker when the screen closes can't refill a shared cache
+        self._diff_syntax = lru_cache(maxsize=16)(_DiffSyntax)
     
     def compose(self):
         """Compose the screen."""
@@ -135,87 +154,306 @@ class DiffScreen(BaseScreen):
     
     def on_mount(self) -> None:
         """Handle mount event."""
+        # Resolve widgets once; they're updated on every load and key press
+        self._stats_panel = self.query_one("#stats_panel", StatisticsPanel)
+        self._file_list = self.query_one("#file_list", FileListPanel)
+        self._diff_title = self.query_one("#diff_title", Label)
+        self._error_panel = self.query_one("#error_panel", Static)
+        self._diff_container = self.query_one("#diff_container", VerticalScroll)
+        self._diff_display = self.query_one("#diff_display", Static)
+        self._apply_button = self.query_one(f"#{BUTTON_APPLY}", Button)
+        
         self._load_diff()
     
+    def on_unmount(self) -> None:
+        """Release the diff text and highlighting once the screen is closed."""
+        self.current_diff = ""
+        self.changed_files = []
+        self._change_starts = []
+        self._shown = None
+        self._clear_diff_cache()
+        self._diff_syntax.cache_clear()
+    
+    def _clear_diff_cache(self) -> None:
+        """Drop cached diffs, including any still being fetched."""
+        self._diff_cache.clear()
+        self._cache_generation += 1
+    
     def _load_diff(self, file_path: str | None = None) -> None:
-        """Load diff."""
-        try:
+        """Load diff in a background worker."""
+        self.run_worker(
+            partial(
+                self._fetch_diff,
+                file_path,
+                dict(self._diff_cache),
+                self._shown,
+                self._cache_generation,
+            ),
+            name="load_diff",
+            group="load_diff",
+            exclusive=True,
+            thread=True,
+            exit_on_error=False,
+        )
+    
+    def _fetch_diff(
+        self,
+        file_path: str | None,
+        cache: dict[str | None, str],
+        shown: tuple[str | None, str] | None,
+        generation: int,
+    ) -> tuple:
+        """Fetch and parse a diff; runs in a worker thread.
+        
+        Args:
+            file_path: Optional specific file to diff
+            cache: Copy of the diff cache when the load started
+            shown: What was on screen when the load started
+            generation: Cache generation when the load started
+            
+        Returns:
+            Tuple of (generation, file_path, diff_text, parsed), where parsed
+            is the result of _prepare_diff, left as None if diff_text is
+            what was shown
+            
+        Raises:
+            ChezmoiCommandError: If chezmoi diff fails
+        """
+        diff_output = cache.get(file_path)
+        if diff_output is None and file_path is not None:
+            diff_output = self._file_section(cache.get(None), file_path)
+        if diff_output is None:
             diff_output = self.chezmoi.diff(file_path)
-            self._update_display(diff_output, file_path)
-        except ChezmoiCommandError as e:
-            self._show_error(str(e))
+        if (file_path, diff_output) == shown:
+            return generation, file_path, diff_output, None
+        return generation, file_path, diff_output, self._prepare_diff(diff_output)
+    
+    def _handle_diff_loaded(
+        self, generation: int, file_path: str | None, diff_text: str, parsed: tuple | None
+    ) -> None:
+        """Cache and show a diff fetched by _fetch_diff."""
+        # A refresh or apply since the fetch started makes it stale
+        if generation == self._cache_generation:
+            self._diff_cache[file_path] = diff_text
+        if parsed is None:
+            if (file_path, diff_text) == self._shown:
+                # Same diff as before; just clear any stale message
+                self._error_panel.display = False
+                return
+            # The screen changed while loading, so it needs parsing after all
+            parsed = self._prepare_diff(diff_text)
+        self._update_display(file_path, diff_text, parsed)
     
-    def _parse_diff(self, diff_text: str) -> tuple[list[str], int, int]:
-        """Parse diff to extract files and statistics.
+    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+        """Handle worker completion."""
+        worker = event.worker
+        if worker.name == "load_diff":
+            if event.state == WorkerState.SUCCESS:
+                self._handle_diff_loaded(*worker.result)
+            elif event.state == WorkerState.ERROR:
+                self._show_error(str(worker.error))
+        elif worker.name == "apply":
+            if event.state == WorkerState.SUCCESS:
+                self._handle_apply_complete(True, worker.result)
+            elif event.state == WorkerState.ERROR:
+                self._handle_apply_complete(False, error=str(worker.error))
+            if worker.is_finished:
+                self._apply_button.disabled = False
+        elif worker.name == "export":
+            if event.state == WorkerState.SUCCESS:
+                self._error_panel.update(f"[green]✓ Exported to {worker.result}[/green]")
+                self._error_panel.remove_class("hidden")
+            elif event.state == WorkerState.ERROR:
+                self._show_error(f"Failed to export: {worker.error}")
+    
+    def _file_section(self, full: str | None, file_path: str) -> str | None:
+        """Cut one file's section out of the full diff.
         
+        Args:
+            full: Cached diff for all files, if any
+            file_path: Path as it appears in the diff header
+            
         Returns:
-            Tuple of (files, additions, deletions)
+            The file's part of the diff, or None if no full diff is cached
+            or the file isn't in it
+        """
+        if not full:
+            return None
+        
+        header = f"{_DIFF_HEADER}{file_path} b/"
+        if full.startswith(header):
+            start = 0
+        else:
+            start = full.find("\n" + header) + 1
+            if not start:
+                return None
+        end = full.find("\n" + _DIFF_HEADER, start) + 1
+        return full[start:end] if end else full[start:]
+    
+    def _parse_diff(self, lines: list[str]) -> tuple[list[str], int, int, list[int]]:
+        """Parse diff lines to extract files and statistics.
+        
+        Args:
+            lines: Lines of the diff output
+            
+        Returns:
+            Tuple of (files, additions, deletions, change_starts), where
+            change_starts holds the ascending line indices that begin a block
+            of added/removed lines
         """
         files = []
         additions = 0
         deletions = 0
+        change_starts = []
+        last_change = -2
         
-        # Extract files from diff headers
-        for match in re.finditer(r'^diff --git a/(.*?) b/.*?$', diff_text, re.MULTILINE):
-            files.append(match.group(1))
-        
-        # Count additions and deletions
-        for line in diff_text.splitlines():
-            if line.startswith('+') and not line.startswith('+++'):
+        # One startswith call skips context lines, which are most of a diff;
+        # the rest are classified by their first character
+        for index, line in enumerate(lines):
+            if not line.startswith(('+', '-', 'd')):
+                continue
+            first = line[0]
+            if first == '+':
+                if line.startswith('+++'):
+                    continue
                 additions += 1
-            elif line.startswith('-') and not line.startswith('---'):
+            elif first == '-':
+                if line.startswith('---'):
+                    continue
                 deletions += 1
+            else:
+                if line.startswith(_DIFF_HEADER):
+                    # "diff --git a/<path> b/<path>": the path ends at the first " b/"
+                    path, sep, _ = line[len(_DIFF_HEADER):].partition(' b/')
+                    if sep:
+                        files.append(path)
+                continue
+            
+            if index != last_change + 1:
+                change_starts.append(index)
+            last_change = index
         
-        return files, additions, deletions
+        return files, additions, deletions, change_starts
     
-    def _update_display(self, diff_text: str, file_path: str | None = None) -> None:
-        """Update the diff display."""
-        self.current_diff = diff_text
+    def _prepare_diff(self, diff_text: str) -> tuple | None:
+        """Parse a diff and trim it for display.
         
+        Args:
+            diff_text: Diff output
+            
+        Returns:
+            None if there is nothing to show, else a tuple of (files,
+            additions, deletions, change_starts, display_text, hidden,
+            highlight), where hidden counts the lines left out of
+            display_text and highlight is False if it is too big to highlight
+        """
         if not diff_text or not diff_text.strip():
-            self.query_one("#diff_display").update("[dim]No changes to display[/dim]")
-            self.query_one("#stats_panel", StatisticsPanel).update_stats(0, 0, 0)
-            self.query_one("#file_list", FileListPanel).update_files([])
+            return None
+        
+        lines = diff_text.splitlines()
+        files, additions, deletions, change_starts = self._parse_diff(lines)
+        
+        # Only highlight the head of very large diffs; tokenizing the whole
+        # thing would stall the UI
+        shown = min(len(lines), DIFF_DISPLAY_MAX_LINES)
+        if shown < len(lines):
+            diff_text = "\n".join(lines[:shown])
+        
+        # A few very long lines can be as slow as thousands of short ones, so
+        # past a size limit cut at a line boundary and skip highlighting
+        highlight = len(diff_text) <= DIFF_HIGHLIGHT_MAX_CHARS
+        if not highlight:
+            cut = diff_text.rfind("\n", 0, DIFF_HIGHLIGHT_MAX_CHARS)
+            if cut < 0:
+                # The first line alone is over the limit
+                cut = DIFF_HIGHLIGHT_MAX_CHARS
+            diff_text = diff_text[:cut]
+            shown = diff_text.count("\n") + 1
+        if shown < len(lines):
+            change_starts = change_starts[:bisect_left(change_starts, shown)]
+        
+        # Run the lexer here rather than on the UI thread at first render
+        if highlight:
+            try:
+                self._diff_syntax(diff_text).prepare()
+            except Exception:
+                # _update_display falls back to plain text
+                logger.exception("Diff highlighting failed")
+        hidden = len(lines) - shown
+        return files, additions, deletions, change_starts, diff_text, hidden, highlight
+    
+    def _update_display(
+        self, file_path: str | None, diff_text: str, parsed: tuple | None
+    ) -> None:
+        """Update the diff display.
+        
+        Args:
+            file_path: File the diff is for, or None for all files
+            diff_text: Full diff output
+            parsed: Result of _prepare_diff for diff_text
+        """
+        self.current_diff = diff_text
+        self._shown = (file_path, diff_text)
+        self._has_changes = parsed is not None
+        
+        if parsed is None:
+            self._change_starts = []
+            self._diff_display.update("[dim]No changes to display[/dim]")
+            self._stats_panel.update_stats(0, 0, 0)
+            self._file_list.update_files([])
             return
         
-        # Parse diff
-        files, additions, deletions = self._parse_diff(diff_text)
+        (
+            files, additions, deletions, self._change_starts,
+            display_text, hidden, highlight,
+        ) = parsed
         self.changed_files = files
         
         # Update statistics
-        self.query_one("#stats_panel", StatisticsPanel).update_stats(
-            len(files), additions, deletions
-        )
+        self._stats_panel.update_stats(len(files), additions, deletions)
         
         # Update file list
-        self.query_one("#file_list", FileListPanel).update_files(files)
+        self._file_list.update_files(files)
         
         # Update title
         title = f"Diff: {file_path}" if file_path else "Diff: All Files"
-        self.query_one("#diff_title").update(title)
+        self._diff_title.update(title)
         
         # Render diff with syntax highlighting
-        try:
-            syntax = Syntax(diff_text, "diff", theme="monokai", line_numbers=True)
-            self.query_one("#diff_display").update(syntax)
-        except Exception:
-            # Fallback to plain text
-            self.query_one("#diff_display").update(diff_text)
+        rendered = None
+        if highlight:
+            try:
+                rendered = self._diff_syntax(display_text)
+            except Exception:
+                logger.exception("Diff highlighting failed; showing plain text")
+        if rendered is None:
+            # Fallback to plain text, cropped like Syntax so each diff line
+            # stays one row and _change_starts still match scroll offsets
+            rendered = Text(display_text, no_wrap=True, overflow="crop")
+        if hidden:
+            rendered = Group(
+                rendered,
+                Text(
+                    f"... {hidden} more lines not shown; use Export to save the full diff",
+                    style="dim",
+                ),
+            )
+        self._diff_display.update(rendered)
         
         # Hide error panel
-        self.query_one("#error_panel").display = False
+        self._error_panel.display = False
     
     def _show_error(self, error: str) -> None:
         """Show an error message."""
-        error_panel = self.query_one("#error_panel")
-        error_panel.update(f"[red]Error:[/red] {error}\n[dim]Suggestions: Check chezmoi status, ensure chezmoi is initialized[/dim]")
-        error_panel.display = True
-        self.query_one("#diff_display").update("")
+        self._shown = None
+        self._error_panel.update(f"[red]Error:[/red] {error}\n[dim]Suggestions: Check chezmoi status, ensure chezmoi is initialized[/dim]")
+        self._error_panel.display = True
+        self._diff_display.update("")
     
     @on(ListView.Selected)
     def on_file_selected(self, event: ListView.Selected) -> None:
         """Handle file selection from list."""
-        if event.item and hasattr(event.item, 'file_path'):
+        if isinstance(event.item, FileListItem):
             self.selected_file = event.item.file_path
             self._load_diff(self.selected_file)
     
@@ -223,29 +461,49 @@ class DiffScreen(BaseScreen):
     def on_refresh(self) -> None:
         """Handle refresh button."""
         self.selected_file = None
+        self._clear_diff_cache()
         self._load_diff()
     
     @on(Button.Pressed, f"#{BUTTON_APPLY}")
     def on_apply(self) -> None:
         """Handle apply button."""
+        if not self._has_changes:
+            self.app.notify("No changes to apply", timeout=2)
+            return
         self._apply_changes(self.selected_file)
     
     def _apply_changes(self, file_path: str | None = None) -> None:
-        """Apply changes."""
-        try:
-            self.chezmoi.apply(file_path)
-            self._handle_apply_complete(True, file_path)
-        except ChezmoiCommandError as e:
-            self._handle_apply_complete(False, file_path, str(e))
+        """Apply changes in a background worker."""
+        # Even a failed apply may have written some files
+        self._clear_diff_cache()
+        # Block a second apply until this one finishes
+        self._apply_button.disabled = True
+        self.run_worker(
+            partial(self._run_apply, file_path),
+            name="apply",
+            group="apply",
+            thread=True,
+            exit_on_error=False,
+        )
+    
+    def _run_apply(self, file_path: str | None) -> str | None:
+        """Run chezmoi apply; runs in a worker thread.
+        
+        Returns:
+            The file_path that was applied, for _handle_apply_complete
+            
+        Raises:
+            ChezmoiCommandError: If chezmoi apply fails
+        """
+        self.chezmoi.apply(file_path)
+        return file_path
     
     def _handle_apply_complete(self, success: bool, file_path: str | None = None, error: str = "") -> None:
         """Handle apply completion."""
-        error_panel = self.query_one("#error_panel")
-        
         if success:
             target = file_path or "all files"
-            error_panel.update(f"[green]✓ Successfully applied changes to {target}[/green]")
-            error_panel.remove_class("hidden")
+            self._error_panel.update(f"[green]✓ Successfully applied changes to {target}[/green]")
+            self._error_panel.remove_class("hidden")
             # Reload diff
             self._load_diff()
         else:
@@ -260,21 +518,34 @@ class DiffScreen(BaseScreen):
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"/tmp/chezmoi_diff_{timestamp}.patch"
         
-        try:
-            Path(filename).write_text(self.current_diff)
-            error_panel = self.query_one("#error_panel")
-            error_panel.update(f"[green]✓ Exported to {filename}[/green]")
-            error_panel.remove_class("hidden")
-        except Exception as e:
-            self._show_error(f"Failed to export: {e}")
+        # Encoding and writing a large diff shouldn't block the UI
+        self.run_worker(
+            partial(self._write_export, filename, self.current_diff),
+            name="export",
+            group="export",
+            thread=True,
+            exit_on_error=False,
+        )
+    
+    def _write_export(self, filename: str, diff_text: str) -> str:
+        """Write a diff to a patch file; runs in a worker thread.
+        
+        Returns:
+            The filename written, for the completion message
+        """
+        Path(filename).write_bytes(diff_text.encode())
+        return filename
     
     def action_next_change(self) -> None:
         """Jump to next change."""
-        # This would require more complex diff parsing
-        pass
+        container = self._diff_container
+        index = bisect_right(self._change_starts, round(container.scroll_y))
+        if index < len(self._change_starts):
+            container.scroll_to(y=self._change_starts[index], animate=False)
     
     def action_prev_change(self) -> None:
         """Jump to previous change."""
-        # This would require more complex diff parsing
-        pass
-
+        container = self._diff_container
+        index = bisect_left(self._change_starts, round(container.scroll_y)) - 1
+        if index >= 0:
+            container.scroll_to(y=self._change_starts[index], animate=False)
@@ -9,51 +9,37 @@ from textual.worker import Worker, WorkerState
 from chezmoi import ChezmoiWrapper
 
 
+def _colorize_output(output: str) -> str:
+    """Mark up doctor output by status, one line at a time.
+
+    Returns:
+        Rich markup for the whole output, or "" if there is none.
+    """
+    if not output.strip():
+        return ""
+
+    parts = []
+    for line in output.splitlines():
+        if "OK" in line or "ok" in line:
+            parts.append(f"[green]{line}[/green]")
+            continue
+        # Lowercase once; this also covers "WARNING" and "ERROR"
+        lowered = line.lower()
+        if "warning" in lowered:
+            parts.append(f"[yellow]{line}[/yellow]")
+        elif "error" in lowered:
+            parts.append(f"[red]{line}[/red]")
+        elif line.startswith("  "):
+            parts.append(f"[dim]{line}[/dim]")
+        else:
+            parts.append(line)
+    return "\n".join(parts)
+
+
 class DoctorScreen(Screen):
     """Screen for running chezmoi doctor diagnostics."""
 
-    CSS = """
-    DoctorScreen {
-        align: center top;
-    }
-
-    #doctor-container {
-        width: 95%;
-        height: 1fr;
-        background: $panel;
-        border: solid $primary;
-        padding: 1 2;
-        margin: 1;
-    }
-
-    #doctor-title {
-        padding: 1 0;
-        text-style: bold;
-    }
-
-    RichLog {
-        height: 1fr;
-        border: solid $accent;
-        background: $surface;
-    }
-
-    #actions-container {
-        dock: bottom;
-        height: auto;
-        width: 95%;
-        padding: 1 2;
-        align: center middle;
-    }
-
-    Button {
-        margin: 0 1;
-    }
-
-    .loading {
-        text-align: center;
-        padding: 2;
-    }
-    """
+    CSS_PATH = "../styles/doctor.tcss"
 
     BINDINGS = [
         ("escape", "pop_screen", "Back"),
@@ -92,23 +78,27 @@ class DoctorScreen(Screen):
 
     def run_doctor(self) -> None:
         """Run doctor diagnostics in background worker."""
-        self.run_worker(self._fetch_doctor_output, exclusive=True, thread=True)
+        self.run_worker(self._fetch_doctor_output, exclusive=True, exit_on_error=False)
 
     async def _fetch_doctor_output(self) -> str:
-        """Fetch doctor output from chezmoi."""
+        """Fetch doctor output from chezmoi, colorized off the UI thread."""
         try:
-            return ChezmoiWrapper.doctor()
+            output = await ChezmoiWrapper.run_blocking(ChezmoiWrapper.doctor)
+            return await ChezmoiWrapper.run_blocking(_colorize_output, output)
         except Exception as e:
-            return f"Error running doctor: {e}"
+            return f"[red]Error running doctor: {e}[/red]"
 
     def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
         """Handle worker completion."""
         if event.state == WorkerState.SUCCESS:
-            if hasattr(event.worker, "result") and event.worker.result is not None:
-                self.update_log(event.worker.result)
-
-    def update_log(self, output: str) -> None:
-        """Update log with doctor output."""
+            result = event.worker.result
+            if result is not None:
+                self.update_log(result)
+        elif event.state == WorkerState.ERROR:
+            self.app.notify(f"Error running doctor: {event.worker.error}", severity="error")
+
+    def update_log(self, markup: str) -> None:
+        """Update log with doctor output colorized by _colorize_output."""
         # Hide loading message
         loading = self.query_one("#loading", Static)
         loading.display = False
@@ -118,20 +108,8 @@ class DoctorScreen(Screen):
         log.display = True
         log.clear()
 
-        if output.strip():
-            # Parse and colorize output
-            lines = output.split("\n")
-            for line in lines:
-                if "OK" in line or "ok" in line:
-                    log.write(f"[green]{line}[/green]")
-                elif "WARNING" in line or "warning" in line.lower():
-                    log.write(f"[yellow]{line}[/yellow]")
-                elif "ERROR" in line or "error" in line.lower():
-                    log.write(f"[red]{line}[/red]")
-                elif line.startswith("  "):
-                    log.write(f"[dim]{line}[/dim]")
-                else:
-                    log.write(line)
+        if markup:
+            log.write(markup)
         else:
             log.write("[yellow]No output from chezmoi doctor[/yellow]")
 
@@ -153,6 +131,7 @@ class DoctorScreen(Screen):
         log = self.query_one("#doctor-log", RichLog)
         log.display = False
 
+        ChezmoiWrapper.clear_caches()
         self.run_doctor()
         self.app.notify("Running diagnostics...", timeout=1)
 
@@ -13,18 +13,7 @@ from ..constants import BUTTON_CANCEL
 class EditScreen(BaseScreen):
     """Screen for editing files."""
     
-    CSS = """
-    EditScreen {
-        align: center middle;
-    }
-    
-    #edit_container {
-        width: 60;
-        height: auto;
-        border: solid $primary;
-        padding: 1;
-    }
-    """
+    CSS_PATH = "../styles/edit.tcss"
     
     def __init__(self, chezmoi: ChezmoiWrapper, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -1,18 +1,34 @@
 """File browser screen for exploring chezmoi source directory."""
 
+import os
 from pathlib import Path
 
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical
 from textual.screen import Screen
 from textual.widgets import Button, DirectoryTree, Footer, Header, Static
+from textual.worker import Worker, WorkerState
 
 from chezmoi import ChezmoiWrapper
 
+# Source files passed to each batched chezmoi target-path call
+_TARGET_BATCH_SIZE = 500
+
+# Source dir -> resolved targets, kept across visits to the screen so the
+# source tree is only walked again on refresh. Only touched on the UI thread.
+_resolved_targets: dict[str, dict[str, str]] = {}
+
 
 class FileInfoPanel(Static):
     """Panel showing information about selected file."""
 
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize the panel."""
+        super().__init__(*args, **kwargs)
+        # Source path -> target path ("" if it has none), so reselecting a
+        # file doesn't rerun chezmoi
+        self.target_cache: dict[str, str] = {}
+
     def compose(self) -> ComposeResult:
         """Create child widgets."""
         yield Static("[bold]File Information[/bold]", id="info-title")
@@ -27,12 +43,18 @@ class FileInfoPanel(Static):
             size_str = self._format_size(size)
 
             # Get target path
-            try:
-                target = ChezmoiWrapper.run_command(
-                    ["target-path", str(path)]
-                ).stdout.strip()
-            except Exception:
-                target = "Unknown"
+            source = str(path)
+            target = self.target_cache.get(source)
+            if target is None:
+                try:
+                    result = ChezmoiWrapper.run_command(["target-path", source])
+                except Exception:
+                    target = "Unknown"
+                else:
+                    target = result.stdout.strip() if result.returncode == 0 else ""
+                    self.target_cache[source] = target
+            if not target:
+                target = "[dim]None (not applied to the home directory)[/dim]"
 
             info_text = f"""[cyan]Source:[/cyan] {path.name}
 [cyan]Target:[/cyan] {target}
@@ -40,7 +62,9 @@ class FileInfoPanel(Static):
 [cyan]Type:[/cyan] File"""
         elif path.is_dir():
             try:
-                file_count = len(list(path.iterdir()))
+                # Count entries without building a Path for each one
+                with os.scandir(path) as entries:
+                    file_count = sum(1 for _ in entries)
             except PermissionError:
                 file_count = 0
 
@@ -64,49 +88,7 @@ class FileInfoPanel(Static):
 class FileBrowserScreen(Screen):
     """Screen for browsing chezmoi source directory."""
 
-    CSS = """
-    FileBrowserScreen {
-        layout: horizontal;
-    }
-
-    #file-tree-container {
-        width: 60%;
-        height: 100%;
-        border-right: solid $primary;
-    }
-
-    #file-info-container {
-        width: 40%;
-        height: 100%;
-        padding: 1 2;
-    }
-
-    DirectoryTree {
-        height: 1fr;
-    }
-
-    #info-title {
-        padding: 1 0;
-        text-style: bold;
-    }
-
-    #info-content {
-        padding: 1 0;
-    }
-
-    #actions-container {
-        dock: bottom;
-        height: auto;
-        width: 100%;
-        background: $panel;
-        border-top: solid $primary;
-        padding: 1 2;
-    }
-
-    Button {
-        margin: 0 1;
-    }
-    """
+    CSS_PATH = "../styles/files.tcss"
 
     BINDINGS = [
         ("escape", "pop_screen", "Back"),
@@ -122,6 +104,7 @@ class FileBrowserScreen(Screen):
             self.source_dir = ChezmoiWrapper.get_source_dir()
         except Exception:
             self.source_dir = Path.home() / ".local" / "share" / "chezmoi"
+        self._targets_worker: Worker | None = None
 
     def compose(self) -> ComposeResult:
         """Create child widgets for the screen."""
@@ -145,6 +128,74 @@ class FileBrowserScreen(Screen):
         """Set up the screen."""
         self.title = "File Browser"
         self.sub_title = f"Browsing: {self.source_dir}"
+        targets = _resolved_targets.get(str(self.source_dir))
+        if targets is None:
+            self.resolve_targets()
+        else:
+            self.query_one(FileInfoPanel).target_cache.update(targets)
+
+    def resolve_targets(self) -> None:
+        """Resolve target paths for the source tree in background worker."""
+        self._targets_worker = self.run_worker(
+            self._fetch_targets, exclusive=True, thread=True, exit_on_error=False
+        )
+
+    def _fetch_targets(self) -> dict[str, str]:
+        """Resolve target paths with batched target-path calls.
+
+        The result fills FileInfoPanel's target cache, so selecting a file
+        only needs a dict lookup. Names starting with "." are skipped, as
+        chezmoi ignores them in the source directory. chezmoi fails a whole
+        batch if any file in it has no target (scripts, ignored files), so a
+        failed batch is retried one file at a time; files that still fail map
+        to "".
+        """
+        targets: dict[str, str] = {}
+        sources = []
+        for root, dirs, files in os.walk(self.source_dir):
+            dirs[:] = [name for name in dirs if not name.startswith(".")]
+            sources.extend(
+                os.path.join(root, name) for name in files if not name.startswith(".")
+            )
+
+        for start in range(0, len(sources), _TARGET_BATCH_SIZE):
+            batch = sources[start : start + _TARGET_BATCH_SIZE]
+            # Each batch is a one-off command line; don't keep it around
+            result = ChezmoiWrapper.run_command(["target-path", *batch], cache=False)
+            lines = result.stdout.splitlines()
+            if result.returncode == 0 and len(lines) == len(batch):
+                targets.update(zip(batch, lines))
+                continue
+            for source in batch:
+                result = ChezmoiWrapper.run_command(
+                    ["target-path", source], cache=False
+                )
+                targets[source] = (
+                    result.stdout.strip() if result.returncode == 0 else ""
+                )
+        return targets
+
+    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+        """Handle worker completion."""
+        # Ignore a resolve that a refresh has since replaced
+        if event.worker is not self._targets_worker:
+            return
+        if event.state == WorkerState.SUCCESS:
+            targets = event.worker.result
+            _resolved_targets[str(self.source_dir)] = targets
+            self.query_one(FileInfoPanel).target_cache.update(targets)
+            unresolved = sum(1 for target in targets.values() if not target)
+            if unresolved:
+                self.app.notify(
+                    f"{unresolved} source file(s) have no target path",
+                    timeout=3,
+                )
+        elif event.state == WorkerState.ERROR:
+            # Selecting a file still looks its target up on its own
+            self.app.notify(
+                f"Error resolving target paths: {event.worker.error}",
+                severity="warning",
+            )
 
     def on_directory_tree_file_selected(
         self, event: DirectoryTree.FileSelected
@@ -175,6 +226,10 @@ class FileBrowserScreen(Screen):
         """Refresh the directory tree."""
         tree = self.query_one(DirectoryTree)
         tree.reload()
+        self.query_one(FileInfoPanel).target_cache.clear()
+        _resolved_targets.pop(str(self.source_dir), None)
+        ChezmoiWrapper.clear_caches()
+        self.resolve_targets()
         self.app.notify("Directory tree refreshed", timeout=1)
 
     def action_show_diff(self) -> None:
@@ -11,22 +11,7 @@ from ..chezmoi_wrapper import ChezmoiWrapper, ChezmoiCommandError
 class ListScreen(BaseScreen):
     """Screen for listing managed files."""
     
-    CSS = """
-    ListScreen {
-        align: center middle;
-    }
-    
-    #list_container {
-        width: 80;
-        height: 30;
-        border: solid $primary;
-        padding: 1;
-    }
-    
-    ListView {
-        height: 1fr;
-    }
-    """
+    CSS_PATH = "../styles/list.tcss"
     
     def __init__(self, chezmoi: ChezmoiWrapper, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -12,46 +12,7 @@ from chezmoi import ChezmoiWrapper
 class ManagedFilesScreen(Screen):
     """Screen for viewing managed files in a table."""
 
-    CSS = """
-    ManagedFilesScreen {
-        align: center top;
-    }
-
-    #table-container {
-        width: 95%;
-        height: 1fr;
-        background: $panel;
-        border: solid $primary;
-        padding: 1 2;
-        margin: 1;
-    }
-
-    #table-title {
-        padding: 1 0;
-        text-style: bold;
-    }
-
-    DataTable {
-        height: 1fr;
-    }
-
-    #actions-container {
-        dock: bottom;
-        height: auto;
-        width: 95%;
-        padding: 1 2;
-        align: center middle;
-    }
-
-    Button {
-        margin: 0 1;
-    }
-
-    .loading {
-        text-align: center;
-        padding: 2;
-    }
-    """
+    CSS_PATH = "../styles/managed.tcss"
 
     BINDINGS = [
         ("escape", "pop_screen", "Back"),
@@ -90,12 +51,13 @@ class ManagedFilesScreen(Screen):
 
     def load_files(self) -> None:
         """Load managed files in background worker."""
-        self.run_worker(self._fetch_files, exclusive=True, thread=True)
+        # The worker awaits an asyncio subprocess, so it needs no thread
+        self.run_worker(self._fetch_files, exclusive=True, exit_on_error=False)
 
     async def _fetch_files(self) -> list[str]:
         """Fetch managed files from chezmoi."""
         try:
-            return ChezmoiWrapper.get_managed_files()
+            return await ChezmoiWrapper.get_managed_files_async()
         except Exception as e:
             self.app.notify(f"Error loading files: {e}", severity="error")
             return []
@@ -103,8 +65,11 @@ class ManagedFilesScreen(Screen):
     def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
         """Handle worker completion."""
         if event.state == WorkerState.SUCCESS:
-            if hasattr(event.worker, "result") and event.worker.result is not None:
-                self.update_table(event.worker.result)
+            result = event.worker.result
+            if result is not None:
+                self.update_table(result)
+        elif event.state == WorkerState.ERROR:
+            self.app.notify(f"Error loading files: {event.worker.error}", severity="error")
 
     def update_table(self, files: list[str]) -> None:
         """Update table with managed files."""
@@ -128,9 +93,8 @@ class ManagedFilesScreen(Screen):
         # Add columns
         table.add_columns("#", "File Path")
 
-        # Add rows
-        for idx, file_path in enumerate(files, 1):
-            table.add_row(str(idx), file_path)
+        # Add rows in one bulk call
+        table.add_rows((str(idx), file_path) for idx, file_path in enumerate(files, 1))
 
         # Update title with count
         title = self.query_one("#table-title", Static)
@@ -157,6 +121,7 @@ class ManagedFilesScreen(Screen):
         table = self.query_one("#files-table", DataTable)
         table.display = False
 
+        ChezmoiWrapper.clear_caches()
         self.load_files()
         self.app.notify("Refreshing file list...", timeout=1)
 
@@ -13,29 +13,7 @@ from ..constants import BUTTON_SUBMIT, BUTTON_CANCEL
 class RemoveScreen(BaseScreen):
     """Screen for removing files."""
     
-    CSS = """
-    RemoveScreen {
-        align: center middle;
-    }
-    
-    #remove_container {
-        width: 60;
-        height: auto;
-        border: solid $primary;
-        padding: 1;
-    }
-    
-    .button-row {
-        layout: horizontal;
-        height: auto;
-        align: center middle;
-        margin: 1 0;
-    }
-    
-    .button-row Button {
-        margin: 0 1;
-    }
-    """
+    CSS_PATH = "../styles/remove.tcss"
     
     def __init__(self, chezmoi: ChezmoiWrapper, *args, **kwargs):
         super().__init__(*args, **kwargs)
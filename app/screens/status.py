@@ -24,27 +24,35 @@ class StatusDisplay(Static):
 
     def load_status(self) -> None:
         """Load status in background worker."""
-        self.run_worker(self._fetch_status, exclusive=True, thread=True)
+        # The worker awaits an asyncio subprocess, so it needs no thread
+        self.run_worker(self._fetch_status, exclusive=True, exit_on_error=False)
 
-    async def _fetch_status(self) -> str:
-        """Fetch status from chezmoi."""
+    async def _fetch_status(self) -> list[tuple[str, str]] | None:
+        """Fetch status records from chezmoi."""
         try:
-            return ChezmoiWrapper.get_status()
+            return [record async for record in ChezmoiWrapper.iter_status()]
         except Exception as e:
-            return f"Error loading status: {e}"
+            self.query_one("#status-content", Label).update(
+                f"Error loading status: {e}"
+            )
+            return None
 
     def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
         """Handle worker completion."""
         if event.state == WorkerState.SUCCESS:
-            if hasattr(event.worker, "result") and event.worker.result is not None:
-                self.update_status(event.worker.result)
-
-    def update_status(self, status: str) -> None:
-        """Update status display."""
+            result = event.worker.result
+            if result is not None:
+                self.update_status(result)
+        elif event.state == WorkerState.ERROR:
+            self.app.notify(f"Error loading status: {event.worker.error}", severity="error")
+
+    def update_status(self, records: list[tuple[str, str]]) -> None:
+        """Update status display from (code, path) records."""
         content = self.query_one("#status-content", Label)
-        if status.strip():
-            # Status output exists - show it
-            content.update(f"[cyan]{status}[/cyan]")
+        if records:
+            # Changes exist - show them
+            lines = "\n".join(f"{code} {path}" for code, path in records)
+            content.update(f"[cyan]{lines}[/cyan]")
         else:
             # No changes
             content.update(
@@ -55,32 +63,7 @@ class StatusDisplay(Static):
 class StatusScreen(Screen):
     """Screen for viewing chezmoi status."""
 
-    CSS = """
-    StatusScreen {
-        align: center top;
-    }
-
-    #status-container {
-        width: 90%;
-        height: auto;
-        max-height: 80%;
-        background: $panel;
-        border: solid $primary;
-        padding: 2 4;
-        margin: 2;
-    }
-
-    #status-actions {
-        width: 90%;
-        height: auto;
-        align: center middle;
-        padding: 1;
-    }
-
-    Button {
-        margin: 0 1;
-    }
-    """
+    CSS_PATH = "../styles/status.tcss"
 
     BINDINGS = [
         ("escape", "pop_screen", "Back"),
@@ -120,6 +103,7 @@ class StatusScreen(Screen):
     def action_refresh(self) -> None:
         """Refresh the status display."""
         status_widget = self.query_one(StatusDisplay)
+        ChezmoiWrapper.clear_caches()
         status_widget.load_status()
         self.app.notify("Refreshing status...", timeout=1)
 
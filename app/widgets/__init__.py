@@ -1,6 +1,6 @@
 """Custom widgets for the application."""
 
-from textual.widgets import Input, Static, Label
+from textual.widgets import Checkbox, Input, Static, Label
 from textual.containers import Container, Vertical
 from textual import on
 from pathlib import Path
@@ -75,14 +75,15 @@ class ResultPanel(Static):
 class OptionsPanel(Container):
     """Panel for chezmoi file options."""
     
+    # Option names, in display order; each maps to a "#<name>_check" checkbox
+    OPTIONS = ("template", "encrypt", "private", "executable", "readonly", "exact")
+    
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.border_title = "Options"
     
     def compose(self):
         """Compose the options panel."""
-        from textual.widgets import Checkbox
-        
         yield Checkbox("Template", id="template_check")
         yield Checkbox("Encrypt", id="encrypt_check")
         yield Checkbox("Private", id="private_check")
@@ -90,33 +91,63 @@ class OptionsPanel(Container):
         yield Checkbox("Readonly", id="readonly_check")
         yield Checkbox("Exact", id="exact_check")
     
+    def on_mount(self) -> None:
+        """Resolve the option checkboxes once."""
+        self._checks = {
+            name: self.query_one(f"#{name}_check", Checkbox) for name in self.OPTIONS
+        }
+    
     def get_options(self) -> dict[str, bool]:
         """Get the current option values.
         
         Returns:
             Dictionary of option names to boolean values
         """
-        return {
-            "template": self.query_one("#template_check").value,
-            "encrypt": self.query_one("#encrypt_check").value,
-            "private": self.query_one("#private_check").value,
-            "executable": self.query_one("#executable_check").value,
-            "readonly": self.query_one("#readonly_check").value,
-            "exact": self.query_one("#exact_check").value,
-        }
+        return {name: check.value for name, check in self._checks.items()}
+    
+    def set_options(self, enabled) -> None:
+        """Check exactly the given options.
+        
+        Args:
+            enabled: Names of the options to check; all others are cleared
+        """
+        for name, check in self._checks.items():
+            check.value = name in enabled
     
     def reset(self) -> None:
         """Reset all options to unchecked."""
-        for checkbox in self.query("Checkbox"):
-            checkbox.value = False
+        for check in self._checks.values():
+            check.value = False
 
 
-class PreviewPanel(Static):
+class PreviewPanel(Container):
     """Panel for previewing changes."""
     
+    # (option name, hint shown while it is enabled), in display order
+    OPTION_HINTS = (
+        ("template", "[yellow]💡 Remember to use {{ .variable }} syntax in templates[/yellow]"),
+        ("encrypt", "[yellow]🔐 File will be encrypted with age[/yellow]"),
+        ("exact", "[yellow]⚠️  Exact mode: file permissions will be preserved exactly[/yellow]"),
+    )
+    
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.border_title = "Preview"
+        # Last inputs and the text pushed to each child, so unchanged parts
+        # aren't rebuilt or re-rendered
+        self._last_state = None
+        self._summary_text = None
+        self._hints_text = None
+    
+    def compose(self):
+        """Compose the preview panel."""
+        yield Static(id="preview_summary")
+        yield Static(id="preview_hints")
+    
+    def on_mount(self) -> None:
+        """Cache the child widgets updated on every preview refresh."""
+        self._summary = self.query_one("#preview_summary", Static)
+        self._hints = self.query_one("#preview_hints", Static)
     
     def update_preview(self, path: str, options: dict[str, bool]) -> None:
         """Update the preview with current settings.
@@ -125,25 +156,32 @@ class PreviewPanel(Static):
             path: File path
             options: Dictionary of options
         """
-        if not path:
-            self.update("[dim]Enter a file path to see preview[/dim]")
+        state = (path, tuple(options.items()))
+        if state == self._last_state:
             return
+        self._last_state = state
         
-        lines = [f"[bold]File:[/bold] {path}"]
-        
-        enabled_options = [k for k, v in options.items() if v]
-        if enabled_options:
-            lines.append(f"[bold]Options:[/bold] {', '.join(enabled_options)}")
+        if not path:
+            summary = "[dim]Enter a file path to see preview[/dim]"
+            hints = []
         else:
-            lines.append("[dim]No options enabled[/dim]")
-        
-        if options.get("template"):
-            lines.append("[yellow]💡 Remember to use {{ .variable }} syntax in templates[/yellow]")
-        
-        if options.get("encrypt"):
-            lines.append("[yellow]🔐 File will be encrypted with age[/yellow]")
+            lines = [f"[bold]File:[/bold] {path}"]
+            
+            enabled_options = [k for k, v in options.items() if v]
+            if enabled_options:
+                lines.append(f"[bold]Options:[/bold] {', '.join(enabled_options)}")
+            else:
+                lines.append("[dim]No options enabled[/dim]")
+            summary = "\n".join(lines)
+            
+            hints = [hint for name, hint in self.OPTION_HINTS if options.get(name)]
         
-        if options.get("exact"):
-            lines.append("[yellow]⚠️  Exact mode: file permissions will be preserved exactly[/yellow]")
+        if summary != self._summary_text:
+            self._summary_text = summary
+            self._summary.update(summary)
         
-        self.update("\n".join(lines))
+        hints_text = "\n".join(hints)
+        if hints_text != self._hints_text:
+            self._hints_text = hints_text
+            self._hints.update(hints_text)
+            self._hints.display = bool(hints_text)
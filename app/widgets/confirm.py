@@ -75,17 +75,19 @@ class ConfirmDialog(ModalScreen[bool]):
             yield Label(self.dialog_message, id="dialog-message")
 
             with Horizontal(id="dialog-buttons"):
-                yield Button(self.confirm_text, variant="error", id="btn-confirm")
-                yield Button(self.cancel_text, variant="default", id="btn-cancel")
+                self._confirm_btn = Button(
+                    self.confirm_text, variant="error", id="btn-confirm"
+                )
+                self._cancel_btn = Button(
+                    self.cancel_text, variant="default", id="btn-cancel"
+                )
+                yield self._confirm_btn
+                yield self._cancel_btn
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
-        if event.button.id == "btn-confirm":
-            self.dismiss(True)
-        else:
-            self.dismiss(False)
+        self.dismiss(event.button is self._confirm_btn)
 
     def on_mount(self) -> None:
         """Focus cancel button on mount."""
-        cancel_btn = self.query_one("#btn-cancel", Button)
-        cancel_btn.focus()
+        self._cancel_btn.focus()
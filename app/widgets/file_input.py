@@ -1,5 +1,7 @@
 """File input widget with validation."""
 
+import os
+import stat
 from pathlib import Path
 
 from textual.app import ComposeResult
@@ -7,6 +9,8 @@ from textual.containers import Horizontal
 from textual.reactive import reactive
 from textual.widgets import Input, Label, Static
 
+from ..constants import PREVIEW_DEBOUNCE
+
 
 class FileInput(Static):
     """Input widget for file paths with validation."""
@@ -23,6 +27,7 @@ class FileInput(Static):
         """
         super().__init__(**kwargs)
         self.placeholder = placeholder
+        self._validate_timer = None
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
@@ -35,45 +40,51 @@ class FileInput(Static):
 
     def on_mount(self) -> None:
         """Set up input focus."""
+        # Resolve the status label once; it is updated on every validation
+        self._status_label = self.query_one("#validation-status", Label)
         self.query_one(Input).focus()
 
     def on_input_changed(self, event: Input.Changed) -> None:
-        """Handle input changes and validate path."""
+        """Handle input changes and schedule path validation."""
         if event.input.id != "file-path-input":
             return
 
         path_str = event.value.strip()
         self.file_path = path_str
 
-        # Expand ~ to home directory
-        if path_str.startswith("~"):
-            path_str = str(Path(path_str).expanduser())
+        if self._validate_timer is not None:
+            self._validate_timer.stop()
+            self._validate_timer = None
 
-        # Validate path
         if not path_str:
             self.is_valid = False
-            self.query_one("#validation-status", Label).update("")
+            self._status_label.update("")
         else:
-            path = Path(path_str)
-            if path.exists():
-                self.is_valid = True
-                if path.is_file():
-                    self.query_one("#validation-status", Label).update(
-                        "[green]✓ File[/green]"
-                    )
-                elif path.is_dir():
-                    self.query_one("#validation-status", Label).update(
-                        "[green]✓ Directory[/green]"
-                    )
-                elif path.is_symlink():
-                    self.query_one("#validation-status", Label).update(
-                        "[green]✓ Symlink[/green]"
-                    )
-            else:
-                self.is_valid = False
-                self.query_one("#validation-status", Label).update(
-                    "[red]✗ Not found[/red]"
-                )
+            # Only hit the filesystem once typing pauses
+            self._validate_timer = self.set_timer(PREVIEW_DEBOUNCE, self._validate)
+
+    def _validate(self) -> None:
+        """Check the current path and show what it points to."""
+        self._validate_timer = None
+        path_str = self.get_path()
+        if not path_str:
+            return
+
+        # One stat call instead of separate exists/is_file/is_dir checks
+        try:
+            mode = os.stat(path_str).st_mode
+        except (OSError, ValueError):
+            self.is_valid = False
+            self._status_label.update("[red]✗ Not found[/red]")
+            return
+
+        self.is_valid = True
+        if stat.S_ISREG(mode):
+            self._status_label.update("[green]✓ File[/green]")
+        elif stat.S_ISDIR(mode):
+            self._status_label.update("[green]✓ Directory[/green]")
+        elif os.path.islink(path_str):
+            self._status_label.update("[green]✓ Symlink[/green]")
 
     def get_path(self) -> str:
         """Get the expanded file path.
@@ -81,10 +92,8 @@ class FileInput(Static):
         Returns:
             str: Expanded file path.
         """
-        path_str = self.file_path.strip()
-        if path_str.startswith("~"):
-            return str(Path(path_str).expanduser())
-        return path_str
+        # String-level expansion; a Path is only built by get_path_obj
+        return os.path.expanduser(self.file_path.strip())
 
     def get_path_obj(self) -> Path:
         """Get the path as a Path object.
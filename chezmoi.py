@@ -1,9 +1,31 @@
 """Wrapper for chezmoi CLI operations."""
 
+import asyncio
+import atexit
+import functools
 import json
+import shutil
 import subprocess
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar, TypeVar
+
+try:
+    # Optional ("fast" extra); parses large template data several times faster
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+_T = TypeVar("_T")
+
+# Shared, bounded pool for blocking chezmoi work started from async code, so
+# screens reuse a few threads instead of starting one per load
+_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="chezmoi")
+atexit.register(_POOL.shutdown, wait=False, cancel_futures=True)
 
 
 class ChezmoiError(Exception):
@@ -41,6 +63,59 @@ class ChezmoiWrapper:
     handling subprocess execution and result parsing.
     """
 
+    # Absolute path of the chezmoi binary, so each spawn skips the PATH search
+    _executable: str | None = None
+
+    # Version and source directory, looked up once; neither changes while
+    # the app runs
+    _version: str | None = None
+    _source_dir: Path | None = None
+
+    # Read-only commands whose successful results are shared for a short time,
+    # so screens opened in quick succession don't each rerun chezmoi
+    _CACHEABLE_COMMANDS = frozenset(
+        {
+            "status",
+            "managed",
+            "diff",
+            "data",
+            "source-path",
+            "target-path",
+            "doctor",
+            "verify",
+        }
+    )
+    _RESULT_TTL = 2.0
+    _RESULT_CACHE_SIZE = 128
+    # Command line -> (timestamp, result), oldest first. Commands run on pool
+    # threads and the event loop at once, so every access holds the lock
+    _results: ClassVar[
+        OrderedDict[tuple[str, ...], tuple[float, subprocess.CompletedProcess]]
+    ] = OrderedDict()
+    _results_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def clear_caches(cls) -> None:
+        """Drop cached lookups so the next call asks chezmoi again."""
+        cls._version = None
+        cls._source_dir = None
+        cls._clear_results()
+
+    @classmethod
+    def _chezmoi(cls) -> str:
+        """Get the chezmoi executable, resolved against PATH on first use.
+
+        Returns:
+            str: Absolute path, or plain "chezmoi" if it isn't on PATH yet.
+        """
+        if cls._executable is None:
+            executable = shutil.which("chezmoi")
+            if executable is None:
+                # Not installed (yet); try the bare name and look again later
+                return "chezmoi"
+            cls._executable = executable
+        return cls._executable
+
     @staticmethod
     def check_installed() -> bool:
         """Check if chezmoi is installed and available.
@@ -50,7 +125,7 @@ class ChezmoiWrapper:
         """
         try:
             result = subprocess.run(
-                ["chezmoi", "--version"],
+                [ChezmoiWrapper._chezmoi(), "--version"],
                 capture_output=True,
                 text=True,
                 timeout=5,
@@ -59,26 +134,31 @@ class ChezmoiWrapper:
         except (subprocess.SubprocessError, FileNotFoundError):
             return False
 
-    @staticmethod
-    def get_version() -> str:
+    @classmethod
+    def get_version(cls) -> str:
         """Get chezmoi version.
 
+        The result is cached after the first successful lookup; see
+        clear_caches().
+
         Returns:
             str: Version string.
 
         Raises:
             ChezmoiNotFoundError: If chezmoi is not installed.
         """
-        try:
-            result = subprocess.run(
-                ["chezmoi", "--version"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            return result.stdout.strip()
-        except FileNotFoundError:
-            raise ChezmoiNotFoundError("chezmoi is not installed or not in PATH")
+        if cls._version is None:
+            try:
+                result = subprocess.run(
+                    [cls._chezmoi(), "--version"],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
+            except FileNotFoundError:
+                raise ChezmoiNotFoundError("chezmoi is not installed or not in PATH")
+            cls._version = result.stdout.strip()
+        return cls._version
 
     @staticmethod
     def run_command(
@@ -86,6 +166,7 @@ class ChezmoiWrapper:
         format: str | None = None,
         check: bool = False,
         timeout: int = 30,
+        cache: bool = True,
     ) -> subprocess.CompletedProcess:
         """Run a chezmoi command.
 
@@ -94,6 +175,8 @@ class ChezmoiWrapper:
             format: Output format (json, yaml, or None).
             check: Raise exception on non-zero exit code.
             timeout: Command timeout in seconds.
+            cache: Reuse and store the result of a read-only command; pass
+                False for one-off calls not worth keeping.
 
         Returns:
             subprocess.CompletedProcess: Command result.
@@ -102,12 +185,21 @@ class ChezmoiWrapper:
             ChezmoiNotFoundError: If chezmoi is not installed.
             subprocess.CalledProcessError: If check=True and command fails.
         """
-        cmd = ["chezmoi"] + args
+        cmd = [ChezmoiWrapper._chezmoi()] + args
         if format:
             cmd += ["--format", format]
 
+        read_only = bool(args) and args[0] in ChezmoiWrapper._CACHEABLE_COMMANDS
+        cacheable = cache and read_only
+        key = tuple(cmd)
+        now = time.monotonic()
+        if cacheable:
+            cached = ChezmoiWrapper._cached_result(key, now)
+            if cached is not None:
+                return cached
+
         try:
-            return subprocess.run(
+            result = subprocess.run(
                 cmd,
                 capture_output=True,
                 text=True,
@@ -116,6 +208,126 @@ class ChezmoiWrapper:
             )
         except FileNotFoundError:
             raise ChezmoiNotFoundError("chezmoi is not installed or not in PATH")
+        finally:
+            if not read_only:
+                # Anything else may change what the read-only commands report
+                ChezmoiWrapper._clear_results()
+
+        if cacheable and result.returncode == 0:
+            ChezmoiWrapper._store_result(key, now, result)
+        return result
+
+    @staticmethod
+    async def run_command_async(
+        args: list[str],
+        format: str | None = None,
+        check: bool = False,
+        timeout: int = 30,
+        cache: bool = True,
+    ) -> subprocess.CompletedProcess:
+        """Run a chezmoi command as an asyncio subprocess.
+
+        Takes the same arguments and shares the result cache with
+        run_command, but waits on the event loop instead of blocking a
+        thread, so independent commands can run concurrently.
+
+        Returns:
+            subprocess.CompletedProcess: Command result.
+
+        Raises:
+            ChezmoiNotFoundError: If chezmoi is not installed.
+            subprocess.CalledProcessError: If check=True and command fails.
+            subprocess.TimeoutExpired: If the command takes too long.
+        """
+        cmd = [ChezmoiWrapper._chezmoi()] + args
+        if format:
+            cmd += ["--format", format]
+
+        read_only = bool(args) and args[0] in ChezmoiWrapper._CACHEABLE_COMMANDS
+        cacheable = cache and read_only
+        key = tuple(cmd)
+        now = time.monotonic()
+        if cacheable:
+            cached = ChezmoiWrapper._cached_result(key, now)
+            if cached is not None:
+                return cached
+
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+            except TimeoutError:
+                proc.kill()
+                await proc.wait()
+                raise subprocess.TimeoutExpired(cmd, timeout)
+        except FileNotFoundError:
+            raise ChezmoiNotFoundError("chezmoi is not installed or not in PATH")
+        finally:
+            if not read_only:
+                # Anything else may change what the read-only commands report
+                ChezmoiWrapper._clear_results()
+
+        result = subprocess.CompletedProcess(
+            cmd,
+            proc.returncode,
+            stdout.decode(errors="replace"),
+            stderr.decode(errors="replace"),
+        )
+        if check:
+            result.check_returncode()
+        if cacheable and result.returncode == 0:
+            ChezmoiWrapper._store_result(key, now, result)
+        return result
+
+    @staticmethod
+    async def run_blocking(func: Callable[..., _T], *args: Any) -> _T:
+        """Run a blocking call in the shared chezmoi thread pool.
+
+        Args:
+            func: Function to call, e.g. ChezmoiWrapper.get_data.
+            *args: Positional arguments for func.
+
+        Returns:
+            Whatever func returns.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_POOL, functools.partial(func, *args))
+
+    @staticmethod
+    def _cached_result(
+        key: tuple[str, ...], now: float
+    ) -> subprocess.CompletedProcess | None:
+        """Get a cached result for a command line if it is still fresh."""
+        with ChezmoiWrapper._results_lock:
+            cached = ChezmoiWrapper._results.get(key)
+        if cached is not None and now - cached[0] < ChezmoiWrapper._RESULT_TTL:
+            return cached[1]
+        return None
+
+    @staticmethod
+    def _store_result(
+        key: tuple[str, ...], now: float, result: subprocess.CompletedProcess
+    ) -> None:
+        """Cache a result, dropping expired entries and the oldest past the cap."""
+        results = ChezmoiWrapper._results
+        expired = time.monotonic() - ChezmoiWrapper._RESULT_TTL
+        with ChezmoiWrapper._results_lock:
+            results[key] = (now, result)
+            results.move_to_end(key)
+            while results and next(iter(results.values()))[0] <= expired:
+                results.popitem(last=False)
+            while len(results) > ChezmoiWrapper._RESULT_CACHE_SIZE:
+                results.popitem(last=False)
+
+    @staticmethod
+    def _clear_results() -> None:
+        """Drop every cached command result."""
+        with ChezmoiWrapper._results_lock:
+            ChezmoiWrapper._results.clear()
 
     @classmethod
     def get_status(cls, targets: list[str] | None = None) -> str:
@@ -133,6 +345,41 @@ class ChezmoiWrapper:
         result = cls.run_command(args)
         return result.stdout
 
+    @classmethod
+    async def get_status_async(cls, targets: list[str] | None = None) -> str:
+        """Get chezmoi status without blocking the event loop.
+
+        Args:
+            targets: Optional list of specific targets to check status for.
+
+        Returns:
+            str: Status output similar to git status.
+        """
+        args = ["status"]
+        if targets:
+            args.extend(targets)
+        result = await cls.run_command_async(args)
+        return result.stdout
+
+    @classmethod
+    async def iter_status(
+        cls, targets: list[str] | None = None
+    ) -> AsyncIterator[tuple[str, str]]:
+        """Iterate over chezmoi status as parsed records.
+
+        Each status line is a two-character code (last written state vs.
+        actual, then actual vs. target, as in git status) and a path.
+
+        Args:
+            targets: Optional list of specific targets to check status for.
+
+        Yields:
+            tuple[str, str]: (code, path) for each changed target.
+        """
+        for line in (await cls.get_status_async(targets)).splitlines():
+            if line:
+                yield line[:2], line[3:]
+
     @classmethod
     def get_managed_files(cls) -> list[str]:
         """Get list of managed files.
@@ -140,13 +387,24 @@ class ChezmoiWrapper:
         Returns:
             list[str]: List of managed file paths.
         """
-        result = cls.run_command(["managed"])
-        if result.returncode == 0 and result.stdout.strip():
-            # Parse line-by-line output
+        return cls._parse_managed(cls.run_command(["managed"]))
+
+    @classmethod
+    async def get_managed_files_async(cls) -> list[str]:
+        """Get list of managed files without blocking the event loop.
+
+        Returns:
+            list[str]: List of managed file paths.
+        """
+        return cls._parse_managed(await cls.run_command_async(["managed"]))
+
+    @staticmethod
+    def _parse_managed(result: subprocess.CompletedProcess) -> list[str]:
+        """Parse `chezmoi managed` output into a list of paths."""
+        if result.returncode == 0:
+            # Parse line-by-line output, stripping each line once
             return [
-                line.strip()
-                for line in result.stdout.strip().split("\n")
-                if line.strip()
+                line for line in map(str.strip, result.stdout.splitlines()) if line
             ]
         return []
 
@@ -215,8 +473,9 @@ class ChezmoiWrapper:
         result = cls.run_command(["data", "--format", "json"])
         if result.returncode == 0 and result.stdout.strip():
             try:
-                return json.loads(result.stdout)
+                return _json_loads(result.stdout)
             except json.JSONDecodeError:
+                # orjson's decode error subclasses this one
                 return {}
         return {}
 
@@ -240,10 +499,19 @@ class ChezmoiWrapper:
     def get_source_dir(cls) -> Path:
         """Get source directory as Path object.
 
+        The result is cached after the first successful lookup; see
+        clear_caches().
+
         Returns:
             Path: Source directory path.
         """
-        return Path(cls.get_source_path())
+        if cls._source_dir is None:
+            source = cls.get_source_path()
+            if not source:
+                # Failed lookup; don't cache it
+                return Path(source)
+            cls._source_dir = Path(source)
+        return cls._source_dir
 
     @classmethod
     def doctor(cls) -> str:
@@ -1,9 +1,13 @@
 """Main application for chezmoi-manager."""
 
+import asyncio
+from collections.abc import Callable
+
 from textual.app import App, ComposeResult
 from textual.widgets import Header, Footer, Button, Static
 from textual.containers import Container, Vertical
 from textual import on
+from textual.worker import Worker, WorkerState
 
 from app.chezmoi_wrapper import ChezmoiWrapper
 from app.constants import (
@@ -96,6 +100,31 @@ class ChezmoiManager(App):
         
         yield Footer()
     
+    def on_mount(self) -> None:
+        """Check chezmoi up front instead of failing on the first screen."""
+        self.run_worker(
+            self.chezmoi.version,
+            name="check_chezmoi",
+            thread=True,
+            exit_on_error=False,
+        )
+    
+    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+        """Show the chezmoi version, or why chezmoi can't be used."""
+        if event.worker.name != "check_chezmoi":
+            return
+        if event.state == WorkerState.SUCCESS:
+            self.query_one("#version", Static).update(
+                f"[dim]{VERSION} · {event.worker.result}[/dim]"
+            )
+        elif event.state == WorkerState.ERROR:
+            self.notify(
+                str(event.worker.error),
+                title="chezmoi unavailable",
+                severity="error",
+                timeout=10,
+            )
+    
     @on(Button.Pressed, f"#{BUTTON_ADD}")
     def action_show_add(self) -> None:
         """Show add file screen."""
@@ -127,10 +156,30 @@ class ChezmoiManager(App):
         self.push_screen(ListScreen(self.chezmoi))
 
 
+def _uvloop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Get uvloop's event loop factory, or None when it isn't installed.
+    
+    uvloop is an optional extra (``pip install chezmoi-manager[fast]``); it
+    lowers scheduling overhead for worker completions and notifications.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
 def main():
     """Run the application."""
     app = ChezmoiManager()
-    app.run()
+    loop_factory = _uvloop_factory()
+    if loop_factory is None:
+        app.run()
+        return
+    # The runner shuts down async generators and the default executor (used
+    # by asyncio.to_thread) before closing the loop, as asyncio.run does
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        app.run(loop=runner.get_loop())
 
 
 if __name__ == "__main__":
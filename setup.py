@@ -8,10 +8,14 @@ setup(
     description="A TUI for managing chezmoi dotfiles",
     author="Scott Williams",
     packages=find_packages(),
+    package_data={"app": ["styles/*.tcss"]},
     install_requires=[
         "textual>=0.40.0",
         "rich>=13.0.0",
     ],
+    extras_require={
+        "fast": ["orjson>=3.10.0", "uvloop>=0.21.0; sys_platform != 'win32'"],
+    },
     entry_points={
         "console_scripts": [
             "chezmoi-manager=main:main",
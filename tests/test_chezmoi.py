@@ -1,9 +1,11 @@
 """Unit tests for ChezmoiWrapper class."""
 
+import asyncio
 import json
 import subprocess
+import threading
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -13,6 +15,10 @@ from chezmoi import ChezmoiCommandError, ChezmoiNotFoundError, ChezmoiWrapper
 class TestChezmoiWrapper:
     """Test cases for ChezmoiWrapper class."""
 
+    def setup_method(self):
+        """Start each test without cached lookups."""
+        ChezmoiWrapper.clear_caches()
+
     @pytest.mark.unit
     def test_check_installed_success(self):
         """Test check_installed returns True when chezmoi is available."""
@@ -46,6 +52,17 @@ class TestChezmoiWrapper:
             version = ChezmoiWrapper.get_version()
             assert version == "chezmoi version v2.65.2"
 
+    @pytest.mark.unit
+    def test_get_version_cached(self):
+        """Test get_version only runs chezmoi once."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(
+                returncode=0, stdout="chezmoi version v2.65.2\n"
+            )
+            ChezmoiWrapper.get_version()
+            ChezmoiWrapper.get_version()
+            assert mock_run.call_count == 1
+
     @pytest.mark.unit
     def test_get_version_not_found(self):
         """Test get_version raises error when chezmoi not found."""
@@ -73,6 +90,20 @@ class TestChezmoiWrapper:
             assert "--format" in call_args
             assert "json" in call_args
 
+    @pytest.mark.unit
+    def test_run_command_uses_resolved_executable(self):
+        """Test run_command runs chezmoi by the path found on PATH."""
+        with (
+            patch.object(ChezmoiWrapper, "_executable", None),
+            patch("shutil.which", return_value="/usr/bin/chezmoi") as mock_which,
+            patch("subprocess.run") as mock_run,
+        ):
+            mock_run.return_value = MagicMock(returncode=0, stdout="")
+            ChezmoiWrapper.run_command(["apply"])
+            ChezmoiWrapper.run_command(["apply"])
+            assert mock_run.call_args[0][0] == ["/usr/bin/chezmoi", "apply"]
+            assert mock_which.call_count == 1
+
     @pytest.mark.unit
     def test_run_command_not_found(self):
         """Test run_command raises error when chezmoi not found."""
@@ -80,6 +111,29 @@ class TestChezmoiWrapper:
             with pytest.raises(ChezmoiNotFoundError):
                 ChezmoiWrapper.run_command(["status"])
 
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_run_command_async_success(self):
+        """Test run_command_async runs chezmoi as an asyncio subprocess."""
+        proc = MagicMock(returncode=0)
+        proc.communicate = AsyncMock(return_value=(b"output", b""))
+        with patch(
+            "asyncio.create_subprocess_exec", new_callable=AsyncMock
+        ) as mock_exec:
+            mock_exec.return_value = proc
+            result = await ChezmoiWrapper.run_command_async(["status"])
+            assert result.returncode == 0
+            assert result.stdout == "output"
+            assert mock_exec.call_args[0][1:] == ("status",)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_run_command_async_not_found(self):
+        """Test run_command_async raises error when chezmoi not found."""
+        with patch("asyncio.create_subprocess_exec", side_effect=FileNotFoundError):
+            with pytest.raises(ChezmoiNotFoundError):
+                await ChezmoiWrapper.run_command_async(["status"])
+
     @pytest.mark.unit
     def test_get_status_success(self):
         """Test get_status returns status output."""
@@ -88,6 +142,41 @@ class TestChezmoiWrapper:
             status = ChezmoiWrapper.get_status()
             assert status == "M .bashrc\n"
 
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_run_blocking_uses_shared_pool(self):
+        """Test run_blocking runs calls on the shared chezmoi threads."""
+        names = await asyncio.gather(
+            *(
+                ChezmoiWrapper.run_blocking(lambda: threading.current_thread().name)
+                for _ in range(8)
+            )
+        )
+        assert all(name.startswith("chezmoi") for name in names)
+        assert len(set(names)) <= 4
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_iter_status(self):
+        """Test iter_status yields (code, path) records."""
+        proc = MagicMock(returncode=0)
+        proc.communicate = AsyncMock(
+            return_value=(b" M .bashrc\nA  .config/app dir/rc\n", b"")
+        )
+        with patch("asyncio.create_subprocess_exec", return_value=proc):
+            records = [record async for record in ChezmoiWrapper.iter_status()]
+            assert records == [(" M", ".bashrc"), ("A ", ".config/app dir/rc")]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_get_managed_files_async(self):
+        """Test get_managed_files_async parses the file list."""
+        proc = MagicMock(returncode=0)
+        proc.communicate = AsyncMock(return_value=(b".bashrc\n.zshrc\n\n", b""))
+        with patch("asyncio.create_subprocess_exec", return_value=proc):
+            files = await ChezmoiWrapper.get_managed_files_async()
+            assert files == [".bashrc", ".zshrc"]
+
     @pytest.mark.unit
     def test_get_status_with_targets(self):
         """Test get_status with specific targets."""
@@ -202,6 +291,98 @@ class TestChezmoiWrapper:
             assert isinstance(path, Path)
             assert str(path) == "/home/user/.local/share/chezmoi"
 
+    @pytest.mark.unit
+    def test_get_source_dir_cached(self):
+        """Test get_source_dir only runs chezmoi once."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(
+                returncode=0, stdout="/home/user/.local/share/chezmoi\n"
+            )
+            first = ChezmoiWrapper.get_source_dir()
+            second = ChezmoiWrapper.get_source_dir()
+            assert first == second
+            assert mock_run.call_count == 1
+
+            ChezmoiWrapper.clear_caches()
+            ChezmoiWrapper.get_source_dir()
+            assert mock_run.call_count == 2
+
+    @pytest.mark.unit
+    def test_read_only_results_cached(self):
+        """Test read-only commands are cached until a mutating command runs."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="M .bashrc\n")
+            ChezmoiWrapper.get_status()
+            ChezmoiWrapper.get_status()
+            assert mock_run.call_count == 1
+
+            ChezmoiWrapper.apply()
+            ChezmoiWrapper.get_status()
+            assert mock_run.call_count == 3
+
+    @pytest.mark.unit
+    def test_failed_results_not_cached(self):
+        """Test failed commands are run again on the next call."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=1, stdout="", stderr="err")
+            ChezmoiWrapper.run_command(["status"])
+            ChezmoiWrapper.run_command(["status"])
+            assert mock_run.call_count == 2
+
+    @pytest.mark.unit
+    def test_result_cache_thread_safe(self):
+        """Test concurrent stores and clears leave the cache consistent."""
+        result = MagicMock(returncode=0)
+        errors = []
+
+        def worker(index: int) -> None:
+            try:
+                for n in range(2000):
+                    ChezmoiWrapper._store_result(("status", str(n % 300)), 0.0, result)
+                    if n % 50 == index:
+                        ChezmoiWrapper._clear_results()
+            except Exception as e:
+                errors.append(e)
+
+        with patch.object(ChezmoiWrapper, "_RESULT_TTL", 1e9):
+            threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        assert errors == []
+        assert len(ChezmoiWrapper._results) <= ChezmoiWrapper._RESULT_CACHE_SIZE
+
+    @pytest.mark.unit
+    def test_uncached_read_only_command(self):
+        """Test cache=False runs the command without touching the cache."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="M .bashrc\n")
+            ChezmoiWrapper.get_status()
+            ChezmoiWrapper.run_command(["target-path", "a"], cache=False)
+            ChezmoiWrapper.run_command(["target-path", "a"], cache=False)
+            assert mock_run.call_count == 3
+            assert list(ChezmoiWrapper._results) == [
+                (ChezmoiWrapper._chezmoi(), "status")
+            ]
+
+    @pytest.mark.unit
+    def test_result_cache_bounded(self):
+        """Test cached results are capped and expired ones pruned on insert."""
+        with (
+            patch("subprocess.run") as mock_run,
+            patch.object(ChezmoiWrapper, "_RESULT_CACHE_SIZE", 3),
+            patch("time.monotonic", return_value=100.0) as mock_time,
+        ):
+            mock_run.return_value = MagicMock(returncode=0, stdout="")
+            for name in ("a", "b", "c", "d"):
+                ChezmoiWrapper.run_command(["target-path", name])
+            assert [key[-1] for key in ChezmoiWrapper._results] == ["b", "c", "d"]
+
+            mock_time.return_value = 110.0
+            ChezmoiWrapper.run_command(["target-path", "e"])
+            assert [key[-1] for key in ChezmoiWrapper._results] == ["e"]
+
     @pytest.mark.unit
     def test_doctor_success(self):
         """Test doctor returns output."""
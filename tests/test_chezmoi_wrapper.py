@@ -1,8 +1,9 @@
 """Tests for ChezmoiWrapper."""
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-from app.chezmoi_wrapper import ChezmoiWrapper, ChezmoiCommandError
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
+from app.chezmoi_wrapper import ChezmoiWrapper, ChezmoiCommandError, _expand
 
 
 class TestChezmoiWrapper:
@@ -10,6 +11,7 @@ class TestChezmoiWrapper:
     
     def setup_method(self):
         """Setup test fixtures."""
+        _expand.cache_clear()
         self.wrapper = ChezmoiWrapper()
     
     def test_init(self):
@@ -287,17 +289,12 @@ class TestChezmoiWrapper:
         args = mock_run.call_args[0][0]
         assert "status" in args
     
-    @patch('pathlib.Path.expanduser')
-    @patch('pathlib.Path.resolve')
+    @patch('os.path.expanduser')
     @patch('subprocess.run')
-    def test_is_managed_true(self, mock_run, mock_resolve, mock_expand):
+    def test_is_managed_true(self, mock_run, mock_expand):
         """Test is_managed returns True for managed file."""
-        # Mock Path operations to return consistent paths
-        mock_path = Mock()
-        mock_path.resolve.return_value = mock_path
-        mock_path.__str__ = Mock(return_value="/home/user/.bashrc")
-        mock_expand.return_value = mock_path
-        mock_resolve.return_value = mock_path
+        # Expand ~ to a fixed home so both sides normalize consistently
+        mock_expand.side_effect = lambda p: p.replace("~", "/home/user", 1)
         
         mock_run.return_value = Mock(
             stdout="/home/user/.bashrc\n",
@@ -334,3 +331,120 @@ class TestChezmoiWrapper:
         result = self.wrapper.is_managed("~/.bashrc")
         
         assert result is False
+    
+    @patch('subprocess.run')
+    def test_managed_cached(self, mock_run):
+        """Test managed files are cached between calls."""
+        mock_run.return_value = Mock(
+            stdout="~/.bashrc\n",
+            stderr="",
+            returncode=0
+        )
+        
+        self.wrapper.managed()
+        self.wrapper.managed()
+        
+        mock_run.assert_called_once()
+    
+    @patch('subprocess.run')
+    def test_managed_cache_invalidated_by_add(self, mock_run):
+        """Test adding a file drops the managed cache."""
+        mock_run.return_value = Mock(
+            stdout="~/.bashrc\n",
+            stderr="",
+            returncode=0
+        )
+        
+        self.wrapper.managed()
+        self.wrapper.add("~/.vimrc")
+        self.wrapper.managed()
+        
+        assert mock_run.call_count == 3
+    
+    @patch('subprocess.run')
+    def test_is_managed_normalizes_managed_paths(self, mock_run):
+        """Test is_managed matches managed entries after expanding ~."""
+        mock_run.return_value = Mock(
+            stdout="~/.bashrc\n~/.vimrc\n",
+            stderr="",
+            returncode=0
+        )
+        
+        assert self.wrapper.is_managed(str(Path.home() / ".bashrc")) is True
+        assert self.wrapper.is_managed("~/.vimrc") is True
+        assert self.wrapper.is_managed("~/.zshrc") is False
+        mock_run.assert_called_once()
+    
+    @patch('subprocess.run')
+    def test_is_managed_relative_output(self, mock_run, tmp_path, monkeypatch):
+        """Test relative managed entries resolve against home, not the cwd."""
+        mock_run.return_value = Mock(
+            stdout=".bashrc\n.config/nvim/init.lua\n",
+            stderr="",
+            returncode=0
+        )
+        monkeypatch.chdir(tmp_path)
+        
+        assert self.wrapper.is_managed("~/.bashrc") is True
+        assert self.wrapper.is_managed("~/.config/nvim/init.lua") is True
+        assert self.wrapper.is_managed(str(tmp_path / ".bashrc")) is False
+    
+    @patch('subprocess.run')
+    def test_run_command_not_found_is_remembered(self, mock_run):
+        """Test a missing executable is only probed once."""
+        mock_run.side_effect = FileNotFoundError
+        
+        with pytest.raises(ChezmoiCommandError):
+            self.wrapper._run_command("status")
+        with pytest.raises(ChezmoiCommandError):
+            self.wrapper._run_command("status")
+        
+        mock_run.assert_called_once()
+    
+    @patch('subprocess.run')
+    def test_version_cached(self, mock_run):
+        """Test version is probed once and cached."""
+        mock_run.return_value = Mock(
+            stdout="chezmoi version v2.65.2\n",
+            stderr="",
+            returncode=0
+        )
+        
+        assert self.wrapper.version() == "chezmoi version v2.65.2"
+        assert self.wrapper.version() == "chezmoi version v2.65.2"
+        mock_run.assert_called_once()
+    
+    @patch('subprocess.run')
+    def test_is_managed_outside_home(self, mock_run):
+        """Test paths outside the home directory skip chezmoi entirely."""
+        result = self.wrapper.is_managed("/tmp/not-a-dotfile")
+        
+        assert result is False
+        mock_run.assert_not_called()
+    
+    @pytest.mark.asyncio
+    @patch('asyncio.create_subprocess_exec', new_callable=AsyncMock)
+    async def test_add_async(self, mock_exec):
+        """Test adding a file through an asyncio subprocess."""
+        proc = Mock(returncode=0)
+        proc.communicate = AsyncMock(return_value=(b"added", b""))
+        mock_exec.return_value = proc
+        self.wrapper._managed_cache = (0.0, ["~/.bashrc"])
+        
+        result = await self.wrapper.add_async("~/.bashrc", private=True)
+        
+        assert result == "added"
+        args = mock_exec.call_args[0]
+        assert args[1:] == ("add", "--private", "~/.bashrc")
+        assert self.wrapper._managed_cache is None
+    
+    @pytest.mark.asyncio
+    @patch('asyncio.create_subprocess_exec', new_callable=AsyncMock)
+    async def test_add_async_failure(self, mock_exec):
+        """Test async add failure raises ChezmoiCommandError."""
+        proc = Mock(returncode=1)
+        proc.communicate = AsyncMock(return_value=(b"", b"error"))
+        mock_exec.return_value = proc
+        
+        with pytest.raises(ChezmoiCommandError, match="error"):
+            await self.wrapper.add_async("~/.bashrc")
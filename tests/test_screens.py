@@ -1,6 +1,7 @@
 """Tests for screens and widgets."""
 
 import pytest
+from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 from textual.widgets import Input
 
@@ -118,3 +119,323 @@ class TestAddDotfileScreen:
         # For now just verify mocks are set up
         assert mock_is_managed is not None
         assert mock_add is not None
+
+
+def _long_line_diff(files: int, width: int) -> str:
+    """Build a diff with one long changed line per file."""
+    lines = []
+    for i in range(files):
+        lines += [
+            f"diff --git a/f{i} b/f{i}",
+            "@@ -1 +1 @@",
+            "-" + "a" * width,
+            "+" + "b" * width,
+        ]
+    return "\n".join(lines) + "\n"
+
+
+class TestDiffScreen:
+    """Test cases for DiffScreen."""
+    
+    @staticmethod
+    async def _show(app, pilot, diff_text: str):
+        """Push a DiffScreen for diff_text and wait for it to render."""
+        from app.screens.diff import DiffScreen
+        chezmoi = Mock(spec=ChezmoiWrapper)
+        chezmoi.diff.return_value = diff_text
+        screen = DiffScreen(chezmoi)
+        await app.push_screen(screen)
+        while screen._shown is None:
+            await pilot.pause(0.05)
+        await pilot.pause()
+        return screen
+    
+    @pytest.mark.asyncio
+    async def test_next_change_plain_text_fallback(self, monkeypatch):
+        """Test n lands on the change when long lines skip highlighting."""
+        from textual.app import App
+        monkeypatch.setattr("app.screens.diff.DIFF_HIGHLIGHT_MAX_CHARS", 2000)
+        app = App()
+        # Wide enough for the "more lines" footer, narrower than the diff
+        async with app.run_test(size=(160, 20)) as pilot:
+            screen = await self._show(app, pilot, _long_line_diff(10, 300))
+            starts = screen._change_starts
+            assert starts
+            # One row per diff line, or the change offsets point at wrong rows
+            display_text, hidden, highlight = screen._prepare_diff(
+                screen.current_diff
+            )[4:]
+            assert not highlight
+            rows = display_text.count("\n") + 1 + (1 if hidden else 0)
+            assert screen._diff_display.size.height == rows
+            
+            await pilot.press("n")
+            await pilot.press("n")
+            assert screen._diff_container.scroll_y == starts[1]
+    
+    @pytest.mark.asyncio
+    async def test_stale_load_not_cached(self):
+        """Test a diff fetched before a refresh doesn't refill the cache."""
+        from textual.app import App
+        app = App()
+        async with app.run_test() as pilot:
+            screen = await self._show(app, pilot, _long_line_diff(2, 10))
+            generation, _, diff_text, parsed = screen._fetch_diff(
+                None, {}, None, screen._cache_generation
+            )
+            screen._clear_diff_cache()
+            screen._handle_diff_loaded(generation, None, diff_text, parsed)
+            assert screen._diff_cache == {}
+            
+            screen._handle_diff_loaded(
+                screen._cache_generation, None, diff_text, parsed
+            )
+            assert screen._diff_cache == {None: diff_text}
+    
+    def test_parse_diff_change_starts(self):
+        """Test each run of added/removed lines is indexed once."""
+        from app.screens.diff import DiffScreen
+        screen = DiffScreen(Mock(spec=ChezmoiWrapper))
+        lines = [
+            "diff --git a/.bashrc b/.bashrc",
+            "--- a/.bashrc",
+            "+++ b/.bashrc",
+            "@@ -1,4 +1,4 @@",
+            " keep",
+            "-old",
+            "+new",
+            " keep",
+            "+added",
+            "diff --git a/.vimrc b/.vimrc",
+            "-gone",
+        ]
+        files, additions, deletions, starts = screen._parse_diff(lines)
+        assert files == [".bashrc", ".vimrc"]
+        assert (additions, deletions) == (2, 2)
+        assert starts == [5, 8, 10]
+    
+    @pytest.mark.asyncio
+    async def test_change_navigation(self):
+        """Test n/p step through change blocks and stop at either end."""
+        from textual.app import App
+        lines = ["diff --git a/f b/f", "@@ -1,40 +1,40 @@"]
+        for _ in range(3):
+            lines += [" context"] * 10 + ["-old", "+new"]
+        lines += [" context"] * 40
+        app = App()
+        async with app.run_test(size=(80, 20)) as pilot:
+            screen = await self._show(app, pilot, "\n".join(lines) + "\n")
+            container = screen._diff_container
+            starts = screen._change_starts
+            assert starts == [12, 24, 36]
+            
+            await pilot.press("p")
+            assert container.scroll_y == 0
+            for start in starts:
+                await pilot.press("n")
+                assert container.scroll_y == start
+            await pilot.press("n")
+            assert container.scroll_y == starts[-1]
+            
+            for start in reversed(starts[:-1]):
+                await pilot.press("p")
+                assert container.scroll_y == start
+            await pilot.press("p")
+            assert container.scroll_y == starts[0]
+    
+    def test_prepare_diff_line_limit(self, monkeypatch):
+        """Test long diffs are cut to DIFF_DISPLAY_MAX_LINES."""
+        from app.screens.diff import DiffScreen
+        monkeypatch.setattr("app.screens.diff.DIFF_DISPLAY_MAX_LINES", 10)
+        screen = DiffScreen(Mock(spec=ChezmoiWrapper))
+        files, additions, _, starts, display_text, hidden, highlight = (
+            screen._prepare_diff(_long_line_diff(5, 10))
+        )
+        # Stats cover the whole diff, the display only its head
+        assert len(files) == 5
+        assert additions == 5
+        assert display_text.splitlines() == _long_line_diff(5, 10).splitlines()[:10]
+        assert hidden == 10
+        assert starts == [2, 6]
+        assert highlight
+    
+    def test_prepare_diff_highlight_limit(self, monkeypatch):
+        """Test diffs over DIFF_HIGHLIGHT_MAX_CHARS are cut and not highlighted."""
+        from app.screens.diff import DiffScreen
+        monkeypatch.setattr("app.screens.diff.DIFF_HIGHLIGHT_MAX_CHARS", 1000)
+        screen = DiffScreen(Mock(spec=ChezmoiWrapper))
+        diff_text = _long_line_diff(10, 200)
+        *_, starts, display_text, hidden, highlight = screen._prepare_diff(diff_text)
+        assert not highlight
+        assert len(display_text) <= 1000
+        # Cut at a line boundary
+        assert diff_text.startswith(display_text + "\n")
+        shown = display_text.count("\n") + 1
+        assert hidden == len(diff_text.splitlines()) - shown
+        assert starts and all(start < shown for start in starts)
+        
+        # A diff under the limit is highlighted in full
+        assert screen._prepare_diff(_long_line_diff(1, 10))[-1]
+    
+    def test_prepare_diff_logs_highlight_failure(self, caplog):
+        """Test a lexer failure is logged rather than silently dropped."""
+        from app.screens.diff import DiffScreen
+        screen = DiffScreen(Mock(spec=ChezmoiWrapper))
+        screen._diff_syntax = Mock(side_effect=ValueError("lexer"))
+        parsed = screen._prepare_diff(_long_line_diff(1, 10))
+        assert parsed is not None
+        assert "Diff highlighting failed" in caplog.text
+
+
+class TestTemplateDataScreen:
+    """Test cases for TemplateDataScreen."""
+    
+    @pytest.mark.asyncio
+    async def test_expand_caps_children(self, monkeypatch):
+        """Test expanding a node loads at most _MAX_CHILDREN children."""
+        from textual.app import App
+        from textual.widgets import Tree
+        from app.screens.data import TemplateDataScreen
+        import chezmoi
+        monkeypatch.setattr("app.screens.data._MAX_CHILDREN", 5)
+        data = {"env": {f"VAR{i}": str(i) for i in range(7)}, "paths": list(range(3))}
+        app = App()
+        with patch.object(chezmoi.ChezmoiWrapper, "get_data", return_value=data):
+            async with app.run_test() as pilot:
+                screen = TemplateDataScreen()
+                await app.push_screen(screen)
+                tree = screen.query_one("#data-tree", Tree)
+                while not tree.display:
+                    await pilot.pause(0.05)
+                
+                env, paths = tree.root.children
+                # Containers start collapsed and empty
+                assert not env.is_expanded and not paths.is_expanded
+                assert not env.children and not paths.children
+                
+                env.expand()
+                await pilot.pause()
+                assert len(env.children) == 6
+                assert "2 more items truncated" in str(env.children[-1].label)
+                
+                paths.expand()
+                await pilot.pause()
+                assert len(paths.children) == 3
+
+
+class TestDoctorScreen:
+    """Test cases for DoctorScreen."""
+    
+    @pytest.mark.asyncio
+    async def test_colorize_failure_shown(self):
+        """Test a failure after chezmoi doctor returns is shown, not fatal."""
+        from textual.app import App
+        from textual.widgets import RichLog
+        from app.screens.doctor import DoctorScreen
+        import chezmoi
+        app = App()
+        with (
+            patch.object(chezmoi.ChezmoiWrapper, "doctor", return_value="ok"),
+            patch("app.screens.doctor._colorize_output", side_effect=ValueError("bad")),
+        ):
+            async with app.run_test() as pilot:
+                screen = DoctorScreen()
+                await app.push_screen(screen)
+                log = screen.query_one("#doctor-log", RichLog)
+                for _ in range(40):
+                    if log.display or not app.is_running:
+                        break
+                    await pilot.pause(0.05)
+                assert app.is_running
+                assert "Error running doctor: bad" in "".join(
+                    strip.text for strip in log.lines
+                )
+
+
+class TestFileBrowserScreen:
+    """Test cases for FileBrowserScreen."""
+    
+    @pytest.mark.asyncio
+    async def test_failed_batch_retried_per_file(self, tmp_path):
+        """Test one file without a target doesn't drop its whole batch."""
+        from textual.app import App
+        from app.screens import files
+        from app.screens.files import FileBrowserScreen, FileInfoPanel
+        import chezmoi
+        for name in ("dot_bashrc", "dot_vimrc", "run_setup.sh"):
+            (tmp_path / name).write_text("")
+        
+        def target_path(args, **kwargs):
+            sources = args[1:]
+            if any(source.endswith("run_setup.sh") for source in sources):
+                return Mock(returncode=1, stdout="", stderr="not a target")
+            stdout = "".join(f"/home/u/{Path(s).name[4:]}\n" for s in sources)
+            return Mock(returncode=0, stdout=stdout)
+        
+        app = App()
+        with (
+            patch.object(
+                chezmoi.ChezmoiWrapper, "get_source_dir", return_value=tmp_path
+            ),
+            patch.object(
+                chezmoi.ChezmoiWrapper, "run_command", side_effect=target_path
+            ) as run_command,
+            patch.dict(files._resolved_targets, clear=True),
+        ):
+            async with app.run_test() as pilot:
+                screen = FileBrowserScreen()
+                await app.push_screen(screen)
+                panel = screen.query_one(FileInfoPanel)
+                for _ in range(40):
+                    if panel.target_cache:
+                        break
+                    await pilot.pause(0.05)
+                cache = panel.target_cache
+                assert cache == {
+                    str(tmp_path / "dot_bashrc"): "/home/u/bashrc",
+                    str(tmp_path / "dot_vimrc"): "/home/u/vimrc",
+                    str(tmp_path / "run_setup.sh"): "",
+                }
+                assert any("1 source file" in n.message for n in app._notifications)
+                
+                # A second visit reuses the resolved targets
+                calls = run_command.call_count
+                app.pop_screen()
+                screen = FileBrowserScreen()
+                await app.push_screen(screen)
+                await pilot.pause()
+                assert screen.query_one(FileInfoPanel).target_cache == cache
+                assert run_command.call_count == calls
+
+
+class TestChezmoiManager:
+    """Test cases for the main app."""
+    
+    @pytest.mark.asyncio
+    async def test_version_shown_on_start(self):
+        """Test the chezmoi version is checked once at startup and shown."""
+        from main import ChezmoiManager
+        with patch.object(
+            ChezmoiWrapper, "version", return_value="chezmoi version v2.65.2"
+        ) as version:
+            app = ChezmoiManager()
+            async with app.run_test() as pilot:
+                await app.workers.wait_for_complete()
+                await pilot.pause()
+                assert "v2.65.2" in str(app.query_one("#version").render())
+            version.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_missing_chezmoi_reported(self):
+        """Test a missing chezmoi binary is reported at startup."""
+        from main import ChezmoiManager
+        app = ChezmoiManager()
+        app.chezmoi = ChezmoiWrapper("/nonexistent/chezmoi")
+        async with app.run_test() as pilot:
+            for _ in range(40):
+                if app._notifications:
+                    break
+                await pilot.pause(0.05)
+            assert any(
+                "chezmoi not found" in n.message for n in app._notifications
+            )
@@ -1,12 +1,25 @@
 """Unit tests for custom widgets."""
 
+import os
 from pathlib import Path
+from unittest.mock import Mock, patch
 
 import pytest
+from textual.app import App
 
+from app.chezmoi_wrapper import ChezmoiWrapper
+from app.constants import PREVIEW_DEBOUNCE
+from app.widgets import PreviewPanel
 from app.widgets.file_input import FileInput
 
 
+class _FileInputApp(App):
+    """App hosting a lone FileInput."""
+
+    def compose(self):
+        yield FileInput()
+
+
 class TestFileInput:
     """Test cases for FileInput widget."""
 
@@ -35,6 +48,33 @@ class TestFileInput:
         assert result.startswith("/")
         assert not result.startswith("~")
 
+    @pytest.mark.unit
+    def test_get_path_expands_home(self, monkeypatch):
+        """Test get_path expands tilde to the home directory."""
+        monkeypatch.setenv("HOME", "/home/tester")
+        widget = FileInput()
+        widget.file_path = " ~/.bashrc "
+        assert widget.get_path() == "/home/tester/.bashrc"
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_typing_validates_once(self, monkeypatch, tmp_path):
+        """Test a burst of keystrokes is validated with a single stat."""
+        from app.widgets import file_input
+
+        monkeypatch.setenv("HOME", str(tmp_path))
+        (tmp_path / "x.txt").write_text("")
+        app = _FileInputApp()
+        async with app.run_test() as pilot:
+            widget = app.query_one(FileInput)
+            with patch.object(file_input.os, "stat", wraps=os.stat) as mock_stat:
+                await pilot.press(*"~/x.txt")
+                await pilot.pause(PREVIEW_DEBOUNCE * 2)
+
+            mock_stat.assert_called_once_with(str(tmp_path / "x.txt"))
+            assert widget.is_valid
+            assert "File" in str(widget.query_one("#validation-status").render())
+
     @pytest.mark.unit
     def test_get_path_obj_returns_path(self):
         """Test get_path_obj returns Path object."""
@@ -62,3 +102,67 @@ class TestFileInput:
         """Test is_valid reactive property defaults to False."""
         widget = FileInput()
         assert widget.is_valid is False
+
+
+class _PreviewApp(App):
+    """App hosting a lone PreviewPanel."""
+
+    def compose(self):
+        yield PreviewPanel()
+
+
+class TestPreviewPanel:
+    """Test cases for PreviewPanel widget."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_summary_and_hints(self):
+        """Test the summary lists enabled options and hints follow them."""
+        app = _PreviewApp()
+        async with app.run_test():
+            panel = app.query_one(PreviewPanel)
+            summary = panel.query_one("#preview_summary")
+            hints = panel.query_one("#preview_hints")
+
+            panel.update_preview("", {"template": True})
+            assert "Enter a file path" in str(summary.render())
+            assert not hints.display
+
+            panel.update_preview("~/.bashrc", {"template": False, "private": False})
+            assert "File: ~/.bashrc" in str(summary.render())
+            assert "No options enabled" in str(summary.render())
+
+            panel.update_preview("~/.bashrc", {"template": True, "encrypt": True})
+            assert "Options: template, encrypt" in str(summary.render())
+            assert hints.display
+            assert "{{ .variable }}" in str(hints.render())
+            assert "encrypted with age" in str(hints.render())
+            assert "Exact mode" not in str(hints.render())
+
+
+class TestAddPresets:
+    """Test cases for the option presets on AddDotfileScreen."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_preset_refreshes_preview_once(self):
+        """Test a preset sets the checkboxes with a single preview refresh."""
+        from app.screens.add import AddDotfileScreen
+
+        app = App()
+        async with app.run_test(size=(120, 60)) as pilot:
+            screen = AddDotfileScreen(Mock(spec=ChezmoiWrapper))
+            await app.push_screen(screen)
+            await pilot.pause()
+            screen._options.set_options(["private", "exact"])
+            await pilot.pause(PREVIEW_DEBOUNCE * 2)
+
+            with patch.object(
+                screen._preview, "update_preview", wraps=screen._preview.update_preview
+            ) as update_preview:
+                screen.query_one("#preset_template").press()
+                await pilot.pause(PREVIEW_DEBOUNCE * 2)
+
+            options = screen._options.get_options()
+            assert [name for name, on in options.items() if on] == ["template"]
+            update_preview.assert_called_once_with("", options)